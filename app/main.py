@@ -4,8 +4,7 @@
 # 차이나는 부분만 ENGINES 레지스트리로 분리 → 새 전략은 레지스트리에 한 항목 추가로 끝.
 
 import sys
-import signal, os, asyncio, logging, threading, time
-from collections import deque
+import signal, os, asyncio, logging, threading, time, functools
 
 if sys.platform.startswith("win"):
     asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
@@ -248,77 +247,115 @@ class BurstWarningTerminator(logging.Handler):
         super().__init__()
         self.threshold = threshold
         self.window_sec = window_sec
+        self._window_ns = int(window_sec * 1_000_000_000)
         self.grace_sec = grace_sec
         self.trigger_level = trigger_level
         self.flush_on_kill = flush_on_kill
-        self._ts = deque()
-        self._lock = threading.Lock()
+        # ✅ 최근 threshold개 시각만 담는 고정 링(락 없음). 방금 쓴 칸의 다음 칸 = 가장 오래된 기록
+        self._ring = [-(1 << 62)] * threshold  # ns 정수(초기값은 충분히 과거)
+        self._n = 0
         self._armed = True
-        logging.captureWarnings(True)
+        self._disarm = threading.Lock()  # 1회성 CAS: 처음 acquire 성공한 스레드만 종료 트리거
+
+    def handle(self, record: logging.LogRecord):
+        # ✅ 폭주 판정은 근사 카운팅이면 충분 → 기본 handle()의 핸들러 RLock 생략(경보 폭주 시 스레드 직렬화 방지)
+        #    계약은 그대로: filter가 LogRecord를 돌려주면(3.12+) 그 레코드로 emit, emit 예외는 handleError로
+        rv = self.filter(record)
+        if isinstance(rv, logging.LogRecord):
+            record = rv
+        if rv:
+            try:
+                self.emit(record)
+            except Exception:
+                self.handleError(record)
+        return rv
 
     def emit(self, record: logging.LogRecord):
         if record.levelno < self.trigger_level or not self._armed:
             return
-        now = time.monotonic()
-        with self._lock:
-            self._ts.append(now)
-            cutoff = now - self.window_sec
-            while self._ts and self._ts[0] < cutoff:
-                self._ts.popleft()
-            if len(self._ts) >= self.threshold:
-                self._armed = False
-                logging.getLogger("system").error(
-                    f"🚨 WARNING {len(self._ts)}회/{self.window_sec:.1f}s → 안전 종료 시도"
-                )
-                self._shutdown()
+        now = time.monotonic_ns()
+        n = self._n
+        self._n = n + 1
+        ring = self._ring
+        ring[n % self.threshold] = now
+        # threshold개 중 가장 오래된 것도 window 안 → window 내 threshold회 이상
+        if now - ring[(n + 1) % self.threshold] <= self._window_ns and self._disarm.acquire(blocking=False):
+            self._armed = False
+            logging.getLogger("system").error(
+                f"🚨 WARNING {self.threshold}회/{self.window_sec:.1f}s → 안전 종료 시도"
+            )
+            self._shutdown()
 
     def _shutdown(self):
-        flush = self.flush_on_kill
+        # ✅ 협조적 종료: 루프의 _await_shutdown이 grace 후 flush → uvicorn server.should_exit.
+        #    (emit은 WS 스레드에서도 불리므로 call_soon_threadsafe로 루프에 넘김)
+        loop, event = _main_loop, _shutdown_event
+        if loop is not None and event is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(loop.call_later, self.grace_sec, event.set)
+            return
+        _hard_kill(self.flush_on_kill)  # 루프 기동 전 → 기존 SIGINT 경로
 
-        def _kill():
-            try:
-                if flush:
-                    logging.getLogger("system").critical("🧯 종료 직전: 로그/텔레그램 flush 시도")
-                    logging.shutdown()
-            finally:
-                try:
-                    os.kill(os.getpid(), signal.SIGINT)
-                except Exception:
-                    raise SystemExit(1)
 
+def _hard_kill(flush: bool) -> None:
+    try:
+        if flush:
+            logging.getLogger("system").critical("🧯 종료 직전: 로그/텔레그램 flush 시도")
+            logging.shutdown()
+    finally:
         try:
-            loop = asyncio.get_running_loop()
-            if loop.is_running():
-                loop.call_later(self.grace_sec, _kill)
-                return
-        except RuntimeError:
-            pass
-        _kill()
+            os.kill(os.getpid(), signal.SIGINT)
+        except Exception:
+            raise SystemExit(1)
+
+
+# startup_event에서 채움. terminator가 set → _await_shutdown이 uvicorn 서버를 정상 종료시킴.
+_main_loop: asyncio.AbstractEventLoop | None = None
+_shutdown_event: asyncio.Event | None = None
+
+
+async def _await_shutdown(flush: bool) -> None:
+    await _shutdown_event.wait()
+    server = getattr(app.state, "server", None)
+    if server is None:  # `uvicorn app.main:app` 등 서버 핸들이 없으면 기존처럼 SIGINT
+        _hard_kill(flush)
+        return
+    if flush:
+        logging.getLogger("system").critical("🧯 종료 직전: 로그/텔레그램 flush 시도")
+        logging.shutdown()
+    server.should_exit = True
 
 
 # ── 로거 (엔진별 텔레그램 토큰 / signals 파일) ──────────────────────────────
 tg_bot = os.getenv(SPEC["tg_token_env"]) or os.getenv(SPEC["tg_token_fallback_env"])
 tg_chat = os.getenv("TELEGRAM_CHAT_ID")
 
-system_logger = setup_logger(
-    "system",
-    logger_level=logging.DEBUG, console_level=logging.DEBUG, file_level=logging.INFO,
-    enable_telegram=True, telegram_level=logging.INFO, exclude_sig_in_file=False,
-    telegram_mode="both", telegram_bot_token=tg_bot, telegram_chat_id=tg_chat,
-)
-_b = SPEC["burst"]
-system_logger.addHandler(BurstWarningTerminator(
-    threshold=_b["threshold"], window_sec=_b["window_sec"], grace_sec=_b["grace_sec"],
-    trigger_level=_b["level"], flush_on_kill=_b["flush"],
-))
-
-trading_logger = setup_logger(
-    "trading",
-    logger_level=logging.DEBUG, console_level=logging.DEBUG, file_level=logging.INFO,
-    enable_telegram=True, telegram_level=logging.INFO,
-    write_signals_file=True, signals_filename=SPEC["signals_file"], exclude_sig_in_file=False,
-    telegram_mode="both", telegram_bot_token=tg_bot, telegram_chat_id=tg_chat,
-)
+@functools.lru_cache(maxsize=None)
+def _loggers():
+    """(system, trading) 로거를 1회만 구성. 같은 이름으로 setup_logger가 두 번 돌며 핸들러가 중복되는 일 방지."""
+    logging.captureWarnings(True)  # warnings.warn → py.warnings 로거(terminator 대상) — 프로세스당 1회
+    system = setup_logger(
+        "system",
+        logger_level=logging.DEBUG, console_level=logging.DEBUG, file_level=logging.INFO,
+        enable_telegram=True, telegram_level=logging.INFO, exclude_sig_in_file=False,
+        telegram_mode="both", telegram_bot_token=tg_bot, telegram_chat_id=tg_chat,
+    )
+    b = SPEC["burst"]
+    system.addHandler(BurstWarningTerminator(
+        threshold=b["threshold"], window_sec=b["window_sec"], grace_sec=b["grace_sec"],
+        trigger_level=b["level"], flush_on_kill=b["flush"],
+    ))
+
+    trading = setup_logger(
+        "trading",
+        logger_level=logging.DEBUG, console_level=logging.DEBUG, file_level=logging.INFO,
+        enable_telegram=True, telegram_level=logging.INFO,
+        write_signals_file=True, signals_filename=SPEC["signals_file"], exclude_sig_in_file=False,
+        telegram_mode="both", telegram_bot_token=tg_bot, telegram_chat_id=tg_chat,
+    )
+    return system, trading
+
+
+system_logger, trading_logger = _loggers()
 
 app = FastAPI()
 manual_queue: Queue = Queue()
@@ -329,61 +366,170 @@ rest_controller = None
 
 
 async def warmup_with_ws_prices(bot: TradeBot, ws, name: str, warmup_timeout):
+    # ✅ 루프에서 쓰는 속성/메서드는 1회만 바인딩(LOAD_FAST)
     MIN_TICKS = bot.jump.history_num
+    count = bot.jump.history_count
+    record = bot.jump.record_price
+    get_price = ws.get_price
+    get_ts = ws.get_last_exchange_ts
     started_at = time.monotonic()
-    while True:
-        try:
-            elapsed = time.monotonic() - started_at
-            missing: dict[str, int] = {}
-            for sym in bot.symbols:
-                price = ws.get_price(sym)
-                exchange_ts = ws.get_last_exchange_ts(sym)
-                if price is not None:
-                    bot.jump.record_price(sym, price, exchange_ts)
-                cur = len(bot.jump.price_history.get(sym, []))
-                if cur < MIN_TICKS:
-                    if warmup_timeout is not None and elapsed >= warmup_timeout:
+
+    # ✅ WS 틱 push → 이벤트 루프 스레드에서 record_price, 전 심볼이 MIN_TICKS 채우면 ready.set()
+    #    → 준비되는 즉시 통과. push 미지원 컨트롤러는 기존처럼 폴링으로 채움.
+    loop = asyncio.get_running_loop()
+    ready = asyncio.Event()
+    pending = set(bot.symbols)
+    last_ts: dict[str, float | None] = {}
+
+    # ✅ push는 틱마다 오지만 check_jump는 polling_interval~×history_num 간격 표본을 전제
+    #    → 심볼별로 polling_interval에 1개만 기록(exchange_ts 기준, 없으면 수신 시각)
+    min_gap = bot.jump.polling_interval
+    last_rec: dict[str, float] = {}
+
+    def _record(sym, price, exchange_ts):
+        if sym not in pending:
+            return
+        ts = exchange_ts or time.time()
+        prev = last_rec.get(sym)
+        if prev is not None and ts - prev < min_gap:
+            return
+        last_rec[sym] = ts
+        record(sym, price, exchange_ts)
+        if count(sym) >= MIN_TICKS:
+            pending.discard(sym)
+            if not pending:
+                ready.set()
+
+    def _on_tick(sym, price, exchange_ts):  # WS 스레드에서 호출됨
+        loop.call_soon_threadsafe(_record, sym, price, exchange_ts)
+
+    add_listener = getattr(ws, "add_tick_listener", None)
+    pushed = callable(add_listener)
+    if pushed:
+        add_listener(_on_tick)
+
+    try:
+        while True:
+            try:
+                elapsed = time.monotonic() - started_at
+                missing: dict[str, int] = {}
+                # ✅ 아직 덜 찬 심볼만 재검사(채워졌거나 타임아웃 스킵된 심볼은 pending에서 빠짐)
+                for sym in tuple(pending):
+                    if not pushed:
+                        price = get_price(sym)
+                        ts = get_ts(sym)
+                        # ✅ 폴링 모드: 직전과 같은 exchange_ts면 새 틱 아님 → 중복 기록 안 함
+                        if price is not None and (ts is None or ts != last_ts.get(sym)):
+                            record(sym, price, ts)
+                            last_ts[sym] = ts
+                    cur = count(sym)
+                    if cur >= MIN_TICKS:
+                        pending.discard(sym)
+                    elif warmup_timeout is not None and elapsed >= warmup_timeout:
+                        pending.discard(sym)
                         system_logger.debug(  # 마감 심볼 워밍업 스킵은 정상 → 텔레그램 안 보냄
-                            f"[{name}] ⏭ [{sym}] 틱 부족({cur}/{MIN_TICKS}), {elapsed:.0f}s 타임아웃 → 스킵"
+                            "[%s] ⏭ [%s] 틱 부족(%d/%d), %.0fs 타임아웃 → 스킵",
+                            name, sym, cur, MIN_TICKS, elapsed,
                         )
                     else:
                         missing[sym] = cur
-            if not missing:
-                system_logger.debug(f"✅ [{name}] 데이터 준비 완료, 메인 루프 시작")
-                return
-            _heartbeat()  # warmup 진행 중에도 살아있음 표시(warmup 행도 healthcheck가 잡게)
-            system_logger.debug(f"⏳ [{name}] 데이터 준비 중... (부족: {missing})")
-            await asyncio.sleep(0.5)
-        except Exception as e:
-            system_logger.error(f"❌ [{name}] warmup 오류: {e}")
-            await asyncio.sleep(1.0)
+                if not missing:
+                    system_logger.debug("✅ [%s] 데이터 준비 완료, 메인 루프 시작", name)
+                    return
+                _heartbeat()  # warmup 진행 중에도 살아있음 표시(warmup 행도 healthcheck가 잡게)
+                # ✅ lazy %-포맷: DEBUG 꺼져 있으면 dict repr(O(n))도 안 만든다
+                system_logger.debug("⏳ [%s] 데이터 준비 중... (부족: %r)", name, missing)
+                try:
+                    await asyncio.wait_for(ready.wait(), timeout=0.5)
+                except asyncio.TimeoutError:
+                    pass
+            except Exception as e:
+                system_logger.error("❌ [%s] warmup 오류: %s", name, e)
+                await asyncio.sleep(1.0)
+    finally:
+        remove_listener = getattr(ws, "remove_tick_listener", None)
+        if pushed and callable(remove_listener):
+            remove_listener(_on_tick)
+
+
+# 메인 루프 최소 간격(초) = 최대 빈도 캡. 새 틱이 오면 이 간격만 지키고 바로 다음 회차.
+#   (jump 감지 윈도우가 0.5s 폴링 간격 전제 → 기본 0.5. 낮추면 신호 지연↓ 대신 jump 리포트 표본 간격도 짧아짐)
+LOOP_PERIOD_SEC = float(_env("BOT_LOOP_MIN_INTERVAL_SEC", "0.5"))
+# 새 틱이 없을 때 다음 회차까지 기다리는 최대 시간(stale 감지/하트비트용 keepalive).
+#   최소 간격과 별개 값 → 틱이 오면 LOOP_PERIOD_SEC마다, 조용하면 이 간격마다만 돈다
+#   (같은 값이면 틱 대기가 고정 sleep과 다를 게 없음). healthcheck(90s)보다 충분히 짧게.
+LOOP_MAX_IDLE_SEC = max(LOOP_PERIOD_SEC, float(_env("BOT_LOOP_MAX_IDLE_SEC", "5")))
 
 
 async def bot_loop(bot: TradeBot, ws, name: str, warmup_timeout):
     await warmup_with_ws_prices(bot, ws, name, warmup_timeout)
     _heartbeat()  # warmup 통과 직후 1회(메인 루프 진입 표시)
+
+    # ✅ WS 틱 도착 → tick_event.set (이미 set이면 스레드 간 wakeup 생략 = 틱 버스트 합치기)
+    loop = asyncio.get_running_loop()
+    tick_event = asyncio.Event()
+
+    def _on_tick(sym, price, exchange_ts):  # WS 스레드에서 호출됨
+        if not tick_event.is_set():
+            loop.call_soon_threadsafe(tick_event.set)
+
+    add_listener = getattr(ws, "add_tick_listener", None)
+    if callable(add_listener):
+        add_listener(_on_tick)
+    else:
+        tick_event = None  # push 미지원 → 고정 주기
+
+    last_run = 0.0
     while True:
         try:
+            # ✅ 최소 간격(최대 빈도 캡): 직전 회차 시작으로부터 남은 시간만 대기
+            wait = LOOP_PERIOD_SEC - (time.perf_counter() - last_run)
+            if wait > 0:
+                await asyncio.sleep(wait)
+            last_run = time.perf_counter()
+            if tick_event is not None:
+                tick_event.clear()
             await bot.run_once()
             _heartbeat()  # run_once가 행되면 여기 도달 못함 → stale → 재기동
-            await asyncio.sleep(0.5)
+            # ✅ run_once 도중 새 틱이 왔으면 바로(캡만 지키고) 다음 회차, 아니면 틱 도착 또는 max idle까지 대기
+            #    idle은 회차 시작 기준으로 잰다(run_once 소요분 차감) → 틱 없을 때 주기 = max(idle, run_once)
+            if tick_event is not None and not tick_event.is_set():
+                try:
+                    await asyncio.wait_for(
+                        tick_event.wait(),
+                        timeout=max(0.0, LOOP_MAX_IDLE_SEC - (time.perf_counter() - last_run)),
+                    )
+                except asyncio.TimeoutError:
+                    pass
         except Exception as e:
-            system_logger.error(f"❌ [{name}] bot_loop 오류: {e}")
+            system_logger.error("❌ [%s] bot_loop 오류: %s", name, e)
             await asyncio.sleep(10)
 
 
 @app.on_event("startup")
 async def startup_event():
-    global bot, ws_controller, rest_controller
+    global bot, ws_controller, rest_controller, _main_loop, _shutdown_event
+
+    _main_loop = asyncio.get_running_loop()
+    _shutdown_event = asyncio.Event()
+    asyncio.create_task(_await_shutdown(SPEC["burst"]["flush"]))
+
+    # ✅ 봇(WS/REST/루프)은 RUN_BOT=1(기본) 프로세스에서만. 여러 워커로 띄울 때 봇 소유 워커 1개만 돈다.
+    if _env("RUN_BOT", "1") != "1":
+        system_logger.debug("⏸ [%s] RUN_BOT!=1 → 봇 미기동(API 전용 워커)", NAME)
+        return
 
     _heartbeat()  # 부팅 즉시 1회 → healthcheck가 워밍업 시작 전에 오인 kill 안 하도록
-    system_logger.debug(f"🚀 신호 봇 시작 (engine={ENGINE}, name={NAME})")
 
     cfg = SPEC["make_config"]()
-    symbols = tuple(getattr(cfg, "symbols", []) or [])
+    symbols = cfg.symbols  # normalized()가 tuple로 고정
     if not symbols:
-        system_logger.error(f"⚠️ [{NAME}] 거래 심볼이 없습니다 — .env(심볼 env) 확인.")
-    system_logger.debug(f"🔧 {NAME} symbols={symbols}, config={cfg.as_dict()}")
+        system_logger.error("⚠️ [%s] 거래 심볼이 없습니다 — .env(심볼 env) 확인.", NAME)
+    # ✅ 시작 정보는 레코드 1건으로(핸들러 왕복 1회). 구조화 값은 extra["summary"]로도 실어 보낸다.
+    if system_logger.isEnabledFor(logging.DEBUG):  # as_dict()는 인자 평가 시점에 돌므로 가드
+        summary = {"engine": ENGINE, "name": NAME, "port": SPEC["port"],
+                   "symbols": symbols, "config": cfg.as_dict()}
+        system_logger.debug("🚀 신호 봇 시작 %s", summary, extra={"summary": summary})
 
     ws_controller, rest_controller = SPEC["make_controllers"](symbols, system_logger)
 
@@ -397,7 +543,10 @@ async def startup_event():
     local_sender = LocalActionSender(targets=targets, system_logger=system_logger, ping_sec=10)
     local_sender.start()
 
-    bot = TradeBot(
+    # ✅ TradeBot 생성 = Redis 로드 + 심볼별 REST 캔들 백필(블로킹 I/O, 풀로 병렬).
+    #    워커 스레드에서 돌려 이벤트 루프는 계속 돈다(sender 연결/핑, 종료 감시가 부트스트랩 동안 멈추지 않음).
+    bot = await asyncio.to_thread(
+        TradeBot,
         ws_controller,
         rest_controller,
         manual_queue,
@@ -414,4 +563,12 @@ async def startup_event():
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run("app.main:app", host="127.0.0.1", port=SPEC["port"], reload=False)
+    # ✅ 평문 HTTP + 127.0.0.1 바인딩 유지. 외부 노출이 필요하면 TLS는 리버스 프록시(nginx/Caddy)에서 종료하고
+    #    proxy_pass http://127.0.0.1:<port> 로 넘긴다. ssl_keyfile/ssl_certfile을 여기 추가하지 말 것
+    #    (핸드셰이크/암복호화가 bot_loop·WS 수신과 같은 이벤트 루프를 잡아먹음).
+    # ✅ 문자열("app.main:app") 대신 app 객체 전달 → `python -m app.main` 실행 시 모듈이 __main__/app.main으로
+    #    두 번 import되며 로거·terminator를 다시 만드는 일 방지
+    # ✅ loop="auto": uvloop 설치돼 있으면 uvloop, 없으면(Windows 포함) asyncio를 uvicorn이 직접 고름
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=SPEC["port"], reload=False, loop="auto"))
+    app.state.server = server  # BurstWarningTerminator → _await_shutdown이 should_exit로 종료
+    server.run()
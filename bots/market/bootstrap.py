@@ -4,25 +4,27 @@ from __future__ import annotations
 from typing import Any, Callable, Dict, List, Optional
 
 
-def bootstrap_candles_for_symbol(
+def backfill_candles_for_symbol(
         rest_client,
-        candle_engine,
-        refresh_indicators: Callable[[str], None],
+        candles,
         symbol: str,
         candles_num: int,
         system_logger=None,
-) -> None:
+) -> bool:
     """
-    과거 캔들 백필 + 인디케이터(MA100 등) 갱신만 담당.
+    과거 캔들 백필만 담당(인디케이터 갱신은 호출측이 한 스레드에서 순차로).
     - 시그널 전용 모드에서도 반드시 필요.
+    - candles: 이 심볼의 캔들 deque(호출측이 미리 꺼내 넘김 → 엔진 dict는 안 건드림)
+    반환: 성공하면 True
     """
     try:
         rest_client.update_candles(
-            candle_engine.get_candles(symbol),
+            candles,
             symbol=symbol,
             count=candles_num,
         )
-        refresh_indicators(symbol)
+        return True
     except Exception as e:
         if system_logger:
             system_logger.warning(f"[{symbol}] 초기 캔들/인디케이터 부트스트랩 실패: {e}")
+        return False
@@ -3,6 +3,7 @@ from __future__ import annotations
 from datetime import datetime, timezone, timedelta
 from decimal import Decimal, ROUND_HALF_UP
 import json
+import math
 from typing import Dict, Optional, List, Tuple, Callable
 from dataclasses import dataclass
 
@@ -16,8 +17,15 @@ def kst_now_str() -> str:
 def quantize_thr(thr: Optional[float], lo: float = 0.005, hi: float = 0.07) -> Optional[float]:
     if thr is None:
         return None
-    v = Decimal(str(max(lo, min(hi, float(thr)))))
-    return float(v.quantize(Decimal("0.0001"), rounding=ROUND_HALF_UP))
+    # ✅ 소수 4자리 ROUND_HALF_UP을 float 연산으로(Decimal 객체 생성 없음). 범위가 양수라 부호 분기 불필요.
+    #    .5 경계 근처(±1e-6)만 기존 Decimal(str(v)) 경로로: 0.01235*1e4 = 123.4999…처럼 이진 표현 오차가
+    #    경계를 넘나드는 건 거기뿐이고, 경계에서 먼 값은 float 판정이 Decimal과 항상 같음 → 결과 완전 동일
+    v = max(lo, min(hi, float(thr)))
+    x = v * 10000.0
+    f = math.floor(x)
+    if abs(x - f - 0.5) > 1e-6:
+        return (f + 1 if x - f > 0.5 else f) / 10000.0
+    return float(Decimal(str(v)).quantize(Decimal("0.0001"), rounding=ROUND_HALF_UP))
 
 
 def arrow(prev: Optional[float], new: Optional[float]) -> str:
@@ -130,6 +138,13 @@ def derive_thresholds_and_log(prev_q: Optional[float], thr_raw: Optional[float])
     return q, mom_thr, log
 
 
+def _last_valid(arr: List[Optional[float]]) -> Optional[float]:
+    for v in reversed(arr):
+        if v is not None:
+            return float(v)
+    return None
+
+
 def refresh_indicators_for_symbol(
     candle_engine,
     indicator_engine,
@@ -161,12 +176,9 @@ def refresh_indicators_for_symbol(
     ma100s[symbol] = res.get("ma100s") or []
 
     arr = ma100s[symbol]
-    now = None
-    for v in reversed(arr):
-        if v is not None:
-            now = float(v)
-            break
-    now_ma100_map[symbol] = now
+    # ✅ 보통 마지막 값이 유효 → O(1). 쉬는 시간(None 꼬리)일 때만 뒤에서부터 탐색
+    v = arr[-1] if arr else None
+    now_ma100_map[symbol] = float(v) if v is not None else _last_valid(arr)
 
     raw_thr = res["q_thr"]
     q, mom_thr, log = derive_thresholds_and_log(prev_q, raw_thr)
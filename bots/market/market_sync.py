@@ -1,10 +1,13 @@
 # bots/market/market_sync.py
 from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Optional, Callable, Any, Dict, List
 
-from .ws_freshness import ws_is_fresh
-from .bootstrap import bootstrap_candles_for_symbol
+from .ws_freshness import ws_is_fresh, ws_fresh_mask
+from .bootstrap import backfill_candles_for_symbol
+import sys
+import threading
 import uuid
 import time  # 파일 상단에 추가
 
@@ -12,6 +15,25 @@ OnPriceFn = Callable[[str, float, Optional[float]], None]
 RefreshFn = Callable[[str], None]
 GetThrFn = Callable[[str], Optional[float]]
 
+_NEVER_NS = -(1 << 62)  # monotonic_ns 쿨다운 초기값("한 번도 안 함")
+_SEC_NS = 1_000_000_000
+_SYM_BACKFILL_COOLDOWN_NS = 30 * _SEC_NS     # 심볼별 REST 백필 쿨다운(30s)
+_GLOBAL_BACKFILL_COOLDOWN_NS = 3 * _SEC_NS   # 전역 REST 백필 쿨다운(3s)
+_STALE_MIN_COUNT = 2   # 연속 stale tick이 이 횟수 이상일 때만 REST 백필 모드
+_GAP_GRACE_SEC = 8     # 분 경계 후 이 시간(초) 안에는 캔들 갭 판정 생략(확정봉 도착 대기)
+
+
+@dataclass(slots=True)
+class _SymState:
+    """심볼별 동기화 상태. tick마다 dict 조회 1번으로 전부 접근(예전엔 심볼 키로 dict 5개)."""
+    fallback_on: bool = False          # REST 백필 모드(WS stale) 여부
+    stale_count: int = 0               # 연속 stale tick 수
+    last_closed_min: Optional[int] = None  # 마지막으로 반영한 확정봉 minute
+    last_backfill_ns: int = _NEVER_NS  # 마지막 REST 백필 시각(monotonic_ns)
+    inflight: bool = False             # REST 백필 진행 중
+    acc_ts: Optional[float] = None     # 마지막으로 누적한 ticker (ts, price) — 새 프레임 없으면 재누적 생략
+    acc_price: Optional[float] = None
+
 @dataclass
 class MarketSyncConfig:
     ws_stale_sec: float
@@ -19,6 +41,7 @@ class MarketSyncConfig:
     candles_num: int
     candle_interval: str = "1"  # "1"(분, 기존) | "D"(일봉). 일봉채널만 "D" → tick이 _tick_daily로 분기.
     daily_backfill_cooldown_sec: float = 3600.0  # 일봉 REST 재갱신 간격(1h). 일봉=하루1봉이라 충분 → 서버부하↓
+    bootstrap_workers: int = 4  # 부트스트랩/tick_all 심볼별 REST 백필 동시 실행 상한(거래소 rate-limit 고려해 작게)
 
 
 class MarketSync:
@@ -46,7 +69,6 @@ class MarketSync:
             jump_service: Optional[Any] = None,  # ✅ 추가
             get_ma_threshold: Optional[GetThrFn] = None,  # ✅ 추가
     ):
-        self.ws = ws
         self.rest = rest
         self.candle = candle_engine
         self.refresh_indicators = refresh_indicators
@@ -55,209 +77,273 @@ class MarketSync:
         self.jump_service = jump_service
         self.get_ma_threshold = get_ma_threshold
         self.cfg = cfg
-        self._subscribed = set()
-        self._last_backfill_at = {}  # ✅ symbol -> time.time() (epoch sec)
 
-        # ✅ 전역 백필 폭주 방지 (최소 변경)
-        self._global_last_backfill_at = 0.0   # 전역 쿨다운(초)
-        self._backfill_inflight = set()       # 심볼 중복 백필 방지
+        self.ws = ws
+        # ✅ WS 컨트롤러 메서드는 생성 후 고정 → 한 번만 해석(틱마다 getattr/callable 반복 제거). 미지원이면 None
+        def _ws_method(name: str):
+            fn = getattr(ws, name, None)
+            return fn if callable(fn) else None
+
+        self._ws_get_price = _ws_method("get_price")
+        self._ws_get_ts = _ws_method("get_last_exchange_ts")
+        self._ws_get_ck = _ws_method("get_last_confirmed_kline")
+        self._ws_get_cks = _ws_method("get_last_confirmed_klines")
+        self._ws_subscribe = _ws_method("subscribe_symbols")
 
+        self._subscribed = set()
+        # ✅ 전역 백필 폭주 방지. 쿨다운은 monotonic_ns 정수 비교(벽시계 점프 무관),
+        #    초기값은 "아주 오래 전" → 부팅 직후에도 즉시 허용
+        self._global_last_backfill_ns = _NEVER_NS   # 전역 쿨다운
+        # ✅ tick은 한 스레드에서 순차지만 inflight 해제는 백필 풀 스레드에서도 일어남 → 쿨다운/inflight check-and-set 보호
+        self._backfill_lock = threading.Lock()
 
-        # 내부 상태(TradeBot에서 빼기 대상)
-        self._rest_fallback_on = {}
-        self._stale_counts = {}
-        self._last_closed_minute = {}
+        # 내부 상태(TradeBot에서 빼기 대상): symbol -> _SymState
+        self._sym: Dict[str, _SymState] = {}
 
     def bootstrap(self, *, symbols: List[str]) -> None:
-        # ✅ 0) WS 구독은 MarketSync 책임 (중복 구독 방지)
-        need = [s for s in symbols if s not in self._subscribed]
-        if need:
-            subscribe = getattr(self.ws, "subscribe_symbols", None)
-            if callable(subscribe):
-                try:
-                    subscribe(*need)
-                    self._subscribed.update(need)
-                    if self.system_logger:
-                        self.system_logger.debug(f"[MarketSync] subscribed: {need}")
-                except Exception as e:
-                    if self.system_logger:
-                        self.system_logger.error(f"[MarketSync] subscribe failed: {e}")
-
-        # 1) 캔들 백필 + 2) 인디케이터 refresh (bootstrap_candles_for_symbol 안에서 수행)
-        for sym in symbols:
-            bootstrap_candles_for_symbol(
+        # ✅ 0) WS 구독은 MarketSync 책임 (중복 구독 방지, 배치 1회)
+        self.subscribe(symbols)
+
+        # 1) 캔들 백필: 네트워크 대기 위주 → 소규모 스레드풀로 병렬.
+        #    ✅ deque는 여기서 미리 꺼냄(엔진 dict 등록은 이 스레드) → 각 작업은 자기 심볼 deque만 씀
+        candles = [self.candle.get_candles(sym) for sym in symbols]
+
+        def _one(sym: str, dq) -> bool:
+            return backfill_candles_for_symbol(
                 rest_client=self.rest,
-                candle_engine=self.candle,
-                refresh_indicators=self.refresh_indicators,
+                candles=dq,
                 symbol=sym,
                 candles_num=self.cfg.candles_num,
                 system_logger=self.system_logger,
             )
 
+        workers = max(1, min(int(self.cfg.bootstrap_workers), len(symbols)))
+        if workers == 1:
+            oks = [_one(sym, dq) for sym, dq in zip(symbols, candles)]
+        else:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bootstrap") as ex:
+                oks = list(ex.map(_one, symbols, candles))  # 예외는 _one 안에서 로깅 후 False
+
+        # 2) 인디케이터 refresh는 이 스레드에서 순차(CPU 작업 + 지표 엔진 공유 상태 → 스레드로 나눠도 이득 없음)
+        for sym, ok in zip(symbols, oks):
+            if not ok:
+                continue
+            try:
+                self.refresh_indicators(sym)
+            except Exception as e:
+                if self.system_logger:
+                    self.system_logger.warning(f"[{sym}] 초기 캔들/인디케이터 부트스트랩 실패: {e}")
+
         if self.system_logger:
             self.system_logger.debug("[MarketSync] bootstrap 완료(캔들/인디케이터)")
 
-    def ensure_symbol(self, symbol: str) -> None:
-        self._rest_fallback_on.setdefault(symbol, False)
-        self._stale_counts.setdefault(symbol, 0)
-        self._last_closed_minute.setdefault(symbol, None)
-        self._last_backfill_at.setdefault(symbol, 0.0)  # ✅ 추가
+    def ensure_symbol(self, symbol: str) -> _SymState:
+        st = self._sym.get(symbol)
+        if st is None:
+            # ✅ 키는 intern해서 저장 → 같은 심볼 문자열(설정/WS 파싱 결과 등)이 조회 시 포인터 비교로 끝남
+            st = self._sym.setdefault(sys.intern(symbol), _SymState())
+        return st
 
 
-    def _can_backfill_now(self, symbol: str, now_ts: float, cooldown_sec: float = 30.0) -> bool:
-        last = float(self._last_backfill_at.get(symbol, 0.0) or 0.0)
-        if (now_ts - last) < float(cooldown_sec):
+    def _can_backfill_now(self, st: _SymState, cooldown_ns: int, now_ns: Optional[int] = None) -> bool:
+        # ✅ 쿨다운은 ns 정수끼리 비교(float 변환 없음). now_ns는 호출측이 한 번 읽어 넘길 수 있음
+        if now_ns is None:
+            now_ns = time.monotonic_ns()
+        if now_ns - st.last_backfill_ns < cooldown_ns:
             return False
-        self._last_backfill_at[symbol] = float(now_ts)
+        st.last_backfill_ns = now_ns
         return True
 
 
-    def _can_backfill_global_now(self, now_ts: float, cooldown_sec: float = 3.0) -> bool:
+    def _can_backfill_global_now(self, cooldown_ns: int, now_ns: Optional[int] = None) -> bool:
         """
         심볼이 여러 개일 때 stale가 동시에 터지면
         REST 백필이 연달아/다발로 나가면서 네트워크/DNS를 더 악화시킬 수 있음.
         -> 프로세스 내 전역 쿨다운으로 '버스트'를 줄인다.
         """
-        last = float(self._global_last_backfill_at or 0.0)
-        if (now_ts - last) < float(cooldown_sec):
-            return False
-        self._global_last_backfill_at = float(now_ts)
-        return True
-
-    def _enter_backfill(self, symbol: str) -> bool:
+        if now_ns is None:
+            now_ns = time.monotonic_ns()
+        with self._backfill_lock:
+            if now_ns - self._global_last_backfill_ns < cooldown_ns:
+                return False
+            self._global_last_backfill_ns = now_ns
+            return True
+
+    def _enter_backfill(self, st: _SymState) -> bool:
         """같은 심볼에 대한 중복 백필 방지"""
-        if symbol in self._backfill_inflight:
-            return False
-        self._backfill_inflight.add(symbol)
-        return True
+        with self._backfill_lock:
+            if st.inflight:
+                return False
+            st.inflight = True
+            return True
 
-    def _exit_backfill(self, symbol: str) -> None:
-        self._backfill_inflight.discard(symbol)
+    def _exit_backfill(self, st: _SymState) -> None:
+        with self._backfill_lock:
+            st.inflight = False
 
 
     def _infer_last_closed_minute_from_engine(self, symbol: str) -> Optional[int]:
         try:
-            candles = self.candle.get_candles(symbol)
+            return self.candle.get_last_minute(symbol)
         except Exception:
             return None
-        if not candles:
-            return None
-
-        last = candles[-1] or {}
-        m = last.get("minute")
-        return int(m) if m is not None else None
 
     def get_price(self, symbol: str, now_ts: float) -> Optional[float]:
-        get_p = getattr(self.ws, "get_price", None)
-        if not callable(get_p):
+        get_p = self._ws_get_price
+        if get_p is None:
             return None
         price = get_p(symbol)
-
-        get_ts = getattr(self.ws, "get_last_exchange_ts", None)
-        exchange_ts = get_ts(symbol) if callable(get_ts) else now_ts
-        if exchange_ts is None:
-            exchange_ts = now_ts
-
-        if price is not None and self.on_price:
+        if price is None:
+            return None
+        # ✅ WS 컨트롤러는 이미 float를 돌려줌 → 타입이 다를 때만 변환(float(float) 재박싱 생략)
+        if type(price) is not float:
+            price = float(price)
+
+        if self.on_price:
+            get_ts = self._ws_get_ts
+            exchange_ts = get_ts(symbol) if get_ts is not None else now_ts
+            if exchange_ts is None:
+                exchange_ts = now_ts
             try:
-                self.on_price(symbol, float(price), float(exchange_ts))
+                self.on_price(symbol, price, exchange_ts if type(exchange_ts) is float else float(exchange_ts))
             except Exception:
                 pass
 
-        return float(price) if price is not None else None
+        return price
 
-    def _backfill_or_accumulate(self, symbol: str, price: Optional[float], now_ts: float) -> None:
+    def _backfill_or_accumulate(
+            self,
+            symbol: str,
+            price: Optional[float],
+            now_ts: float,
+            fresh: Optional[bool] = None,
+            deferred: Optional[List[tuple]] = None,
+    ) -> bool:
         """
         - WS fresh면 ticker로 진행중 봉 누적
-        - stale면 REST 백필 + 지표갱신
+        - stale면 REST 백필 (deferred가 주어지면 실행하지 않고 (symbol, False)만 담아 호출측에 넘김)
+        반환: REST 백필로 캔들이 바뀌어 지표 갱신이 필요하면 True.
+        (갱신은 tick 끝에서 1회 — 같은 tick에 확정봉 반영도 있으면 그쪽 refresh로 합쳐짐)
         """
-        use_ws = ws_is_fresh(self.ws, symbol, self.cfg.ws_stale_sec, self.cfg.ws_global_stale_sec)
+        st = self._sym[symbol]
+        if fresh is None:
+            fresh = ws_is_fresh(self.ws, symbol, self.cfg.ws_stale_sec, self.cfg.ws_global_stale_sec)
+        use_ws = fresh
         if use_ws:
-            get_ts = getattr(self.ws, "get_last_exchange_ts", None)
-            ts = (get_ts(symbol) if callable(get_ts) else now_ts) or now_ts
-            if price is not None:
-                self.candle.accumulate_with_ticker(symbol, float(price), float(ts))
-
-            if self._rest_fallback_on[symbol]:
-                self._rest_fallback_on[symbol] = False
+            get_ts = self._ws_get_ts
+            ts = (get_ts(symbol) if get_ts is not None else now_ts) or now_ts
+            if price is not None:  # price는 get_price에서 이미 float
+                if type(ts) is not float:
+                    ts = float(ts)
+                # ✅ 새 WS 프레임이 없으면 (ts, price)가 직전과 같음 → 같은 값 재누적은 봉 상태를 안 바꾸므로 생략
+                #    (확정봉 반영이 진행중 봉을 비우면 acc_ts를 리셋 → 다음 tick은 예전처럼 다시 누적)
+                if ts != st.acc_ts or price != st.acc_price:
+                    self.candle.accumulate_with_ticker(symbol, price, ts)
+                    st.acc_ts = ts
+                    st.acc_price = price
+
+            if st.fallback_on:
+                st.fallback_on = False
                 if self.system_logger:
                     self.system_logger.info(f"[{symbol}] ✅ WS 복구, 실시간 집계 재개")
 
-            self._stale_counts[symbol] = 0
-            return
+            st.stale_count = 0
+            return False
 
         # stale
-        self._stale_counts[symbol] += 1
-        if self._stale_counts[symbol] < 2:
-            return
+        st.stale_count += 1
+        if st.stale_count < _STALE_MIN_COUNT:
+            return False
 
-        if not self._rest_fallback_on[symbol]:
-            self._rest_fallback_on[symbol] = True
+        if not st.fallback_on:
+            st.fallback_on = True
             if self.system_logger:
                 self.system_logger.warning(f"[{symbol}] ⚠️ WS stale → REST 백필")
 
-        # ✅ 심볼별 쿨다운
-        if not self._can_backfill_now(symbol, now_ts, cooldown_sec=30.0):
-            return
+        # ✅ 심볼별 쿨다운 (시계는 1회만 읽어 전역 쿨다운과 공유)
+        now_ns = time.monotonic_ns()
+        if not self._can_backfill_now(st, _SYM_BACKFILL_COOLDOWN_NS, now_ns):
+            return False
 
         # ✅ 전역 쿨다운 (연쇄 백필 버스트 방지)
-        if not self._can_backfill_global_now(now_ts, cooldown_sec=3.0):
-            return
+        if not self._can_backfill_global_now(_GLOBAL_BACKFILL_COOLDOWN_NS, now_ns):
+            return False
 
         # ✅ 같은 심볼 중복 백필 방지
-        if not self._enter_backfill(symbol):
-            return
+        if not self._enter_backfill(st):
+            return False
 
+        if deferred is not None:
+            deferred.append((symbol, False))  # inflight는 _rest_backfill이 끝나며 해제
+            return False
+        return self._rest_backfill(symbol, False)
+
+    def _rest_backfill(self, symbol: str, daily: bool) -> bool:
+        """REST 캔들 백필 1건(_enter_backfill 성공 후 호출). 성공하면 True, inflight는 항상 해제."""
+        st = self._sym[symbol]
         try:
-            self.rest.update_candles(
-                self.candle.get_candles(symbol),
-                symbol=symbol,
-                count=self.cfg.candles_num
-            )
-            try:
-                self.refresh_indicators(symbol)
-            except Exception as e:
-                if self.system_logger:
-                    self.system_logger.warning(
-                        f"[{symbol}] refresh_indicators failed: {e}"
-                    )
+            if daily:
+                self.rest.update_candles(self.candle.get_candles(symbol), symbol=symbol,
+                                         count=self.cfg.candles_num, interval="D")
+            else:
+                self.rest.update_candles(
+                    self.candle.get_candles(symbol),
+                    symbol=symbol,
+                    count=self.cfg.candles_num
+                )
+            return True
         except Exception as e:
             # 네트워크/DNS 흔들릴 때 예외가 바깥으로 퍼지는 걸 방지
             if self.system_logger:
-                self.system_logger.debug(
-                    f"❌ [REST backfill] ({symbol}) failed: {e}"
-                )
+                tag = "일봉 backfill" if daily else "REST backfill"
+                self.system_logger.debug(f"❌ [{tag}] ({symbol}) failed: {e}")
+            return False
         finally:
-            self._exit_backfill(symbol)
+            self._exit_backfill(st)
 
-    def _apply_confirmed_kline_if_any(self, symbol: str) -> bool:
-        get_ck = getattr(self.ws, "get_last_confirmed_kline", None)
-        if not callable(get_ck):
-            return False
+    def fresh_mask(self, symbols: List[str]) -> Dict[str, bool]:
+        """전 심볼 WS freshness를 사이클당 1회 판정. tick(fresh=...)으로 넘긴다."""
+        return ws_fresh_mask(self.ws, symbols, self.cfg.ws_stale_sec, self.cfg.ws_global_stale_sec)
+
+    def confirmed_klines(self, symbols: List[str]) -> Optional[Dict[str, Optional[dict]]]:
+        """
+        전 심볼 확정봉(1분) 스냅샷. 사이클마다 1회 호출해 tick(klines=...)으로 넘긴다.
+        WS 컨트롤러가 배치 조회를 지원하지 않으면 None → tick이 심볼별로 조회.
+        """
+        get_cks = self._ws_get_cks
+        if get_cks is None:
+            return None
+        return get_cks(symbols, "1")
+
+    def _apply_confirmed_kline_if_any(self, symbol: str, klines: Optional[Dict[str, Optional[dict]]] = None) -> bool:
+        if klines is not None:
+            k = klines.get(symbol)
+        else:
+            get_ck = self._ws_get_ck
+            if get_ck is None:
+                return False
+            k = get_ck(symbol, "1")
 
-        k = get_ck(symbol, "1")
         if not (k and k.get("confirm")):
             return False
 
+        st = self._sym[symbol]
         k_start_minute = int(k["start"] // 60000)
-        if k_start_minute == self._last_closed_minute[symbol]:
+        if k_start_minute == st.last_closed_min:
             return False
 
         self.candle.apply_confirmed_kline(symbol, k)
+        st.acc_ts = None  # 진행중 봉이 비워졌을 수 있음 → 다음 ticker는 반드시 누적
         self.refresh_indicators(symbol)
-        self._last_closed_minute[symbol] = k_start_minute
+        st.last_closed_min = k_start_minute
         return True
 
-    def _sec_into_minute(self, now_ts: float) -> float:
-        # now_ts: epoch seconds
-        return now_ts - (int(now_ts) // 60) * 60
-
-    def _backfill_if_candle_gap(self, symbol: str, now_ts: float) -> None:
-        now_min = int((now_ts * 1000) // 60000)
-
-        GRACE_SEC = 8.0
-        if self._sec_into_minute(now_ts) < GRACE_SEC:
+    def _backfill_if_candle_gap(self, symbol: str, now_sec: int) -> None:
+        # now_sec: int(epoch seconds). 분 경계 후 GRACE 이내면 스킵.
+        # ✅ 정수 비교: floor(t) % 60 < 8  ⇔  (t - 분시작) < 8.0  (8이 정수라 동치) → float 뺄셈 불필요
+        if now_sec % 60 < _GAP_GRACE_SEC:
             return
+        now_min = now_sec // 60
 
         expected_closed = now_min - 1  # ✅ "지금 시점에서 닫혀 있어야 정상인 마지막 분"
         engine_last = self._infer_last_closed_minute_from_engine(symbol)
@@ -270,10 +356,10 @@ class MarketSync:
         if (expected_closed - int(engine_last)) < 2:
             return
 
-    def _tick_daily(self, symbol: str, now_ts: float) -> Optional[float]:
+    def _tick_daily(self, symbol: str, now_ts: float, deferred: Optional[List[tuple]] = None) -> Optional[float]:
         """일봉 채널 전용 tick(분 로직 완전 우회·격리). 라이브 가격=ticker(WS),
         캔들=일봉 REST 주기 백필. 분 단위 확정봉/갭백필 로직 안 씀 → 1분 서비스 무영향."""
-        self.ensure_symbol(symbol)
+        st = self.ensure_symbol(symbol)
         price = self.get_price(symbol, now_ts)
         if price is not None and self.on_price:
             try:
@@ -281,33 +367,102 @@ class MarketSync:
             except Exception:
                 pass
         # 일봉 캔들 REST 주기 갱신 (긴 쿨다운). 분 WS 캔들 미사용.
-        if self._can_backfill_now(symbol, now_ts, cooldown_sec=self.cfg.daily_backfill_cooldown_sec) \
-                and self._enter_backfill(symbol):
-            try:
-                self.rest.update_candles(self.candle.get_candles(symbol), symbol=symbol,
-                                         count=self.cfg.candles_num, interval="D")
+        if self._can_backfill_now(st, int(self.cfg.daily_backfill_cooldown_sec * _SEC_NS)) \
+                and self._enter_backfill(st):
+            if deferred is not None:
+                deferred.append((symbol, True))
+            elif self._rest_backfill(symbol, True):
                 try:
                     self.refresh_indicators(symbol)
                 except Exception:
                     pass
-            except Exception as e:
-                if self.system_logger:
-                    self.system_logger.debug(f"❌ [일봉 backfill] ({symbol}) failed: {e}")
-            finally:
-                self._exit_backfill(symbol)
         return price
 
-    def tick(self, symbol: str, now_ts: float) -> Optional[float]:
+    def tick(
+            self,
+            symbol: str,
+            now_ts: float,
+            klines: Optional[Dict[str, Optional[dict]]] = None,
+            fresh: Optional[Dict[str, bool]] = None,
+    ) -> Optional[float]:
+        return self._tick(symbol, now_ts, klines, fresh)
+
+    def tick_all(
+            self,
+            symbols: List[str],
+            now_ts: float,
+            klines: Optional[Dict[str, Optional[dict]]] = None,
+            fresh: Optional[Dict[str, bool]] = None,
+    ) -> List[Any]:
+        """
+        전 심볼 tick을 호출 스레드 하나에서 순차 실행 → 캔들 엔진/지표/_SymState는 계속 이 스레드만 만짐
+        (락 없이 단일 접근자 유지, CPU 작업인 지표 계산은 어차피 스레드로 나눠도 이득 없음).
+        stale REST 백필만 모아 뒤에서 동시에 돌리고, 끝나면 지표 갱신은 다시 이 스레드에서 순차로.
+        반환: 심볼 순서대로 price 또는 그 심볼 tick에서 난 예외(호출측이 심볼별로 처리).
+        """
+        deferred: List[tuple] = []
+        out: List[Any] = []
+        for symbol in symbols:
+            try:
+                out.append(self._tick(symbol, now_ts, klines, fresh, deferred))
+            except Exception as e:
+                out.append(e)
+        if deferred:
+            self._run_deferred_backfills(deferred)
+        return out
+
+    def _run_deferred_backfills(self, jobs: List[tuple]) -> None:
+        # ✅ 네트워크 대기만 병렬: 각 작업은 자기 심볼 캔들 deque만 쓰고, 그동안 tick 스레드는 결과를
+        #    기다리므로 같은 deque에 동시 접근 없음. 동시 실행 상한은 부트스트랩과 같은 값(rate-limit)
+        for sym, _ in jobs:
+            self.candle.get_candles(sym)  # 엔진 dict 등록은 이 스레드에서 → 풀에서는 조회만
+        workers = max(1, min(int(self.cfg.bootstrap_workers), len(jobs)))
+        if workers == 1:
+            oks = [self._rest_backfill(sym, daily) for sym, daily in jobs]
+        else:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="backfill") as ex:
+                oks = list(ex.map(lambda job: self._rest_backfill(*job), jobs))
+
+        # 확정봉 반영 뒤에 캔들이 바뀌었으므로 같은 tick의 refresh와 합치지 않고 여기서 다시 갱신
+        for (sym, daily), ok in zip(jobs, oks):
+            if not ok:
+                continue
+            try:
+                self.refresh_indicators(sym)
+            except Exception as e:
+                if self.system_logger and not daily:
+                    self.system_logger.warning(f"[{sym}] refresh_indicators failed: {e}")
+
+    def _tick(
+            self,
+            symbol: str,
+            now_ts: float,
+            klines: Optional[Dict[str, Optional[dict]]] = None,
+            fresh: Optional[Dict[str, bool]] = None,
+            deferred: Optional[List[tuple]] = None,
+    ) -> Optional[float]:
         if self.cfg.candle_interval == "D":
-            return self._tick_daily(symbol, now_ts)
+            return self._tick_daily(symbol, now_ts, deferred)
         self.ensure_symbol(symbol)  # ✅ 여기 추가
         price = self.get_price(symbol, now_ts)
-        self._backfill_or_accumulate(symbol, price, now_ts)
+        need_refresh = self._backfill_or_accumulate(
+            symbol, price, now_ts, fresh.get(symbol) if fresh is not None else None, deferred
+        )
+
+        # 확정봉 반영 시 그 안에서 refresh → REST 백필분 refresh는 중복이라 생략(tick당 최대 1회)
+        did_close = self._apply_confirmed_kline_if_any(symbol, klines)
 
-        did_close = self._apply_confirmed_kline_if_any(symbol)
+        if need_refresh and not did_close:
+            try:
+                self.refresh_indicators(symbol)
+            except Exception as e:
+                if self.system_logger:
+                    self.system_logger.warning(
+                        f"[{symbol}] refresh_indicators failed: {e}"
+                    )
 
         if not did_close:
-            self._backfill_if_candle_gap(symbol, now_ts)
+            self._backfill_if_candle_gap(symbol, int(now_ts))
 
         # ✅ tick 끝에서 jump 상태 갱신 (TradeBot에서 제거할 부분)
         if self.jump_service and self.get_ma_threshold:
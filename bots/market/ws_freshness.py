@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 import time
-from typing import Any, Optional
+from typing import Any, Dict, Iterable, Optional
 
 
 def _to_sec_epoch(ts: Optional[float]) -> Optional[float]:
@@ -65,3 +65,29 @@ def ws_is_fresh(ws: Any, symbol: str, ws_stale_sec: float, ws_global_stale_sec:
         return (now_epoch - sym_ts) <= float(ws_stale_sec)
 
     return False
+
+
+def ws_fresh_mask(
+    ws: Any,
+    symbols: Iterable[str],
+    ws_stale_sec: float,
+    ws_global_stale_sec: float,
+) -> Dict[str, bool]:
+    """
+    ws_is_fresh의 전 심볼 배치 버전(사이클당 1회).
+    - get_last_recv_map 지원 시: lock 1회 스냅샷 + monotonic 1회로 전 심볼 판정
+      (전역 recv가 최신이면 ws_is_fresh 1-2 단계처럼 전부 fresh)
+    - 미지원이면 심볼별 ws_is_fresh로 폴백(결과 동일)
+    """
+    symbols = list(symbols)
+    get_map = getattr(ws, "get_last_recv_map", None)
+    if not callable(get_map):
+        return {s: ws_is_fresh(ws, s, ws_stale_sec, ws_global_stale_sec) for s in symbols}
+
+    global_recv, sym_recv = get_map(symbols)
+    now_mono = time.monotonic()
+    if global_recv is not None and (now_mono - float(global_recv)) <= float(ws_global_stale_sec):
+        return dict.fromkeys(symbols, True)
+
+    stale = float(ws_stale_sec)
+    return {s: (t is not None and (now_mono - float(t)) <= stale) for s, t in sym_recv.items()}
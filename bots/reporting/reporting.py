@@ -1,43 +1,36 @@
 # bots/reporting/reporting.py
 from __future__ import annotations
 
-from datetime import datetime, timezone, timedelta
+from dataclasses import dataclass
 from typing import Any, Dict, Optional, Tuple, Callable, List, Union
 import re
 
-# enabled(기존) 헤더: [SYM] 👀 ma_thr(0.50%) ...
-_HEADER_MA_RE = re.compile(
-    r"^\[(?P<sym>[A-Z0-9]+)\]\s+(?P<emoji>[📈📉👀—])\s+ma_thr\(\s*(?P<thr>[0-9.]+)\s*%\s*\)"
+# 헤더 1줄 = 정규식 1회 매칭(disabled 분기 우선, 실패 시 enabled 분기)
+#   disabled: [SYM] 🚫 disabled (...)
+#   enabled : [SYM] 👀 ma_thr(0.50%) ...
+_HEADER_RE = re.compile(
+    r"^\[(?P<sym>[A-Z0-9]+)\]\s+"
+    r"(?:(?P<disabled>🚫)\s+disabled"
+    r"|(?P<emoji>[📈📉👀—])\s+ma_thr\(\s*(?P<thr>[0-9.]+)\s*%\s*\))"
 )
 
-# disabled 헤더: [SYM] 🚫 disabled (...)
-_HEADER_DISABLED_RE = re.compile(
-    r"^\[(?P<sym>[A-Z0-9]+)\]\s+🚫\s+disabled(?:\s+\(thr\((?P<thr>[0-9.]+)\%\))?"
-)
-
-KST = timezone(timedelta(hours=9))
-
 _POS_RE = re.compile(
     r"^\s*-\s*포지션:\s*(?P<side>LONG|SHORT)\s*\(\s*(?P<qty>\d+(?:\.\d+)?)\s*,\s*[^,]+,\s*(?P<pct>[+\-]?\d+\.\d+)%"
 )
 
 
-def make_status_line(
+def _format_status_line(
     symbol: str,
-    jump_state: Dict[str, Dict[str, Any]],
-    ma_threshold: Dict[str, Optional[float]],
-    now_ma100: Dict[str, Optional[float]],
-    get_price: Callable[[str], Optional[float]],
-    ma_check_enabled: Optional[Dict[str, bool]] = None,
-    min_ma_threshold: Optional[Union[Dict[str, Optional[float]], float]] = None,
+    state: Any,
+    min_dt: Optional[float],
+    max_dt: Optional[float],
+    price: Optional[float],
+    ma: Optional[float],
+    thr: Optional[float],
+    enabled: bool,
+    min_thr: Optional[float],
 ) -> str:
-    js = (jump_state or {}).get(symbol, {})
-    state = js.get("state")
-    min_dt = js.get("min_dt")
-    max_dt = js.get("max_dt")
-
-    price = get_price(symbol)
-    ma = now_ma100.get(symbol)
+    # ✅ dict/콜러블 조회가 끝난 원시값만 받아 포맷(build에서 심볼 루프 밖 준비 재사용)
     diff_pct = (
         (price - ma) / ma * 100.0
         if (price is not None and ma not in (None, 0))
@@ -46,54 +39,76 @@ def make_status_line(
 
     emoji = "📈" if state == "UP" else ("📉" if state == "DOWN" else "👀")
 
-    thr = ma_threshold.get(symbol)  # None 유지
     thr_pct = (float(thr) * 100.0) if (thr is not None) else None
-
-    enabled = True
-    if ma_check_enabled is not None:
-        enabled = bool(ma_check_enabled.get(symbol, True))
-
-    # min_thr
-    min_thr = None
-    if min_ma_threshold is not None:
-        min_thr = (
-            min_ma_threshold.get(symbol)
-            if isinstance(min_ma_threshold, dict)
-            else float(min_ma_threshold)
-        )
     min_thr_pct = (float(min_thr) * 100.0) if (min_thr is not None) else None
 
-    parts: List[str] = []
+    # ✅ 조각을 out 하나에 모아 마지막에 "".join 1회(구분 공백은 조각에 포함)
+    out: List[str] = ["[", symbol, "] "]
 
     if not enabled:
         if thr is None:
             if min_thr_pct is not None:
-                parts.append(f"🚫 disabled (thr(None) < min({min_thr_pct:.2f}%))")
+                out.append("🚫 disabled (thr(None) < min(%.2f%%))" % min_thr_pct)
             else:
-                parts.append("🚫 disabled")
+                out.append("🚫 disabled")
         else:
             if min_thr_pct is not None:
-                parts.append(
-                    f"🚫 disabled (thr({thr_pct:.2f}%) < min({min_thr_pct:.2f}%))"
-                )
+                out.append("🚫 disabled (thr(%.2f%%) < min(%.2f%%))" % (thr_pct, min_thr_pct))
             else:
-                parts.append(f"🚫 disabled (thr({thr_pct:.2f}%))")
+                out.append("🚫 disabled (thr(%.2f%%))" % thr_pct)
     else:
         if thr_pct is not None:
-            parts.append(f"{emoji} ma_thr({thr_pct:.2f}%)")
+            out.append("%s ma_thr(%.2f%%)" % (emoji, thr_pct))
         else:
-            parts.append(f"{emoji} ma_thr(-)")
+            out.append(emoji + " ma_thr(-)")
 
     if price is not None:
-        parts.append(f"P={price:.2f}")
+        out.append(" P=%.2f" % price)
     if ma is not None:
-        parts.append(f"MA100={ma:.2f}")
+        out.append(" MA100=%.2f" % ma)
     if diff_pct is not None:
-        parts.append(f"ΔP/MA={diff_pct:+.2f}%")
+        out.append(" ΔP/MA=%+.2f%%" % diff_pct)
     if min_dt is not None and max_dt is not None:
-        parts.append(f"Δt={min_dt:.3f}~{max_dt:.3f}s")
+        out.append(" Δt=%.3f~%.3fs" % (min_dt, max_dt))
+
+    return "".join(out)
+
+
+def make_status_line(
+    symbol: str,
+    jump_state: Dict[str, Dict[str, Any]],
+    ma_threshold: Dict[str, Optional[float]],
+    now_ma100: Dict[str, Optional[float]],
+    get_price: Callable[[str], Optional[float]],
+    ma_check_enabled: Optional[Dict[str, bool]] = None,
+    min_ma_threshold: Optional[Union[Dict[str, Optional[float]], float]] = None,
+) -> str:
+    js = (jump_state or {}).get(symbol, {})
+
+    enabled = True
+    if ma_check_enabled is not None:
+        enabled = bool(ma_check_enabled.get(symbol, True))
+
+    # min_thr
+    min_thr = None
+    if min_ma_threshold is not None:
+        min_thr = (
+            min_ma_threshold.get(symbol)
+            if isinstance(min_ma_threshold, dict)
+            else float(min_ma_threshold)
+        )
 
-    return f"[{symbol}] " + " ".join(parts)
+    return _format_status_line(
+        symbol,
+        js.get("state"),
+        js.get("min_dt"),
+        js.get("max_dt"),
+        get_price(symbol),
+        now_ma100.get(symbol),
+        ma_threshold.get(symbol),  # None 유지
+        enabled,
+        min_thr,
+    )
 
 
 def build_market_status_log(
@@ -105,80 +120,114 @@ def build_market_status_log(
     ma_check_enabled: Optional[Dict[str, bool]] = None,
     min_ma_threshold: Optional[Union[Dict[str, Optional[float]], float]] = None,
 ) -> str:
+    # ✅ 심볼 공통 준비(dict 바인딩, min_thr 타입 판별)는 루프 밖에서 1회
+    js_get = (jump_state or {}).get
+    thr_get = ma_threshold.get
+    ma_get = now_ma100.get
+    en_get = ma_check_enabled.get if ma_check_enabled is not None else None
+    min_get = min_ma_threshold.get if isinstance(min_ma_threshold, dict) else None
+    min_const = (
+        float(min_ma_threshold)
+        if (min_ma_threshold is not None and min_get is None)
+        else None
+    )
+
     lines: List[str] = ["\n📡 MARKET STATUS"]
     for sym in symbols:
+        js = js_get(sym, {})
         lines.append(
-            make_status_line(
+            _format_status_line(
                 sym,
-                jump_state,
-                ma_threshold,
-                now_ma100,
-                get_price,
-                ma_check_enabled=ma_check_enabled,
-                min_ma_threshold=min_ma_threshold,
+                js.get("state"),
+                js.get("min_dt"),
+                js.get("max_dt"),
+                get_price(sym),
+                ma_get(sym),
+                thr_get(sym),
+                bool(en_get(sym, True)) if en_get is not None else True,
+                min_get(sym) if min_get is not None else min_const,
             )
         )
     return "\n".join(lines).rstrip()
 
+
+@dataclass(slots=True)
+class SymSummary:
+    """심볼별 상태 요약(로그 변화 판정용). 심볼마다 작은 dict 대신 슬롯 객체 1개."""
+    jump: str = "—"
+    enabled: Optional[bool] = None
+    ma_thr: Optional[float] = None
+
+
+_MISSING_SUMMARY = SymSummary()  # 한쪽에만 있는 심볼의 비교 기준(읽기 전용)
+
+
 def extract_market_status_summary(
     text: str,
     fallback_ma_threshold_pct: Optional[Union[Dict[str, Optional[float]], float]] = None,
-) -> Dict[str, Any]:
-    summary: Dict[str, Any] = {}
-    cur_sym: Optional[str] = None
+) -> Dict[str, SymSummary]:
+    summary: Dict[str, SymSummary] = {}
+    match = _HEADER_RE.match
 
     for raw in text.splitlines():
         line = raw.strip()
-
-        md = _HEADER_DISABLED_RE.match(line)
-        if md:
-            cur_sym = md.group("sym")
-            summary.setdefault(cur_sym, {"jump": "—", "enabled": None, "ma_thr": None})
-            summary[cur_sym]["enabled"] = False
+        # ✅ 헤더는 항상 "["로 시작 → 타이틀/빈 줄은 정규식 없이 통과
+        if not line.startswith("["):
+            continue
+        m = match(line)
+        if m is None:
             continue
+        cur_sym, disabled, emoji, thr = m.group("sym", "disabled", "emoji", "thr")
 
-        m = _HEADER_MA_RE.match(line)
-        if m:
-            cur_sym = m.group("sym")
-            summary.setdefault(cur_sym, {"jump": m.group("emoji"), "enabled": None, "ma_thr": None})
-            summary[cur_sym]["enabled"] = True
-            summary[cur_sym]["jump"] = m.group("emoji")
-            try:
-                summary[cur_sym]["ma_thr"] = float(m.group("thr"))
-            except Exception:
-                summary[cur_sym]["ma_thr"] = None
+        ss = summary.get(cur_sym)
+        if ss is None:
+            ss = summary[cur_sym] = SymSummary(jump="—" if disabled else emoji)
+
+        if disabled:
+            ss.enabled = False
             continue
 
+        ss.enabled = True
+        ss.jump = emoji
+        try:
+            ss.ma_thr = float(thr)
+        except Exception:
+            ss.ma_thr = None
+
     return summary
 
 
 def should_log_update_market(
-    old_summary: Optional[Dict[str, Any]],
-    new_summary: Dict[str, Any],
+    old_summary: Optional[Dict[str, SymSummary]],
+    new_summary: Dict[str, SymSummary],
 ) -> Tuple[bool, Optional[str]]:
     if old_summary is None:
         return True, "initial snapshot"
 
-    def _as_float(x: Any) -> Optional[float]:
-        try:
-            return None if x is None else float(x)
-        except Exception:
-            return None
+    # ✅ 변화 없음(대부분의 tick) → dict 동등 비교 1회로 종료(SymSummary는 필드 튜플 비교)
+    #    같으면 아래 심볼별 비교도 전부 통과하므로 결과 동일
+    if new_summary == old_summary:
+        return False, None
 
-    symbols = set(new_summary.keys()) | set(old_summary.keys())
-    for sym in symbols:
-        n = new_summary.get(sym, {"jump": "—", "enabled": None, "ma_thr": None})
-        o = old_summary.get(sym, {"jump": "—", "enabled": None, "ma_thr": None})
+    # ✅ 바뀐 심볼만 추려(SymSummary 동등 비교) 이름순으로 사유 작성 → 사유 심볼이 실행마다 같음
+    new_get, old_get = new_summary.get, old_summary.get
+    changed = sorted(
+        sym for sym in new_summary.keys() | old_summary.keys()
+        if new_get(sym, _MISSING_SUMMARY) != old_get(sym, _MISSING_SUMMARY)
+    )
+    for sym in changed:
+        n = new_get(sym, _MISSING_SUMMARY)
+        o = old_get(sym, _MISSING_SUMMARY)
 
-        ne, oe = n.get("enabled"), o.get("enabled")
+        ne, oe = n.enabled, o.enabled
         if (ne is None) != (oe is None) or (ne is not None and oe is not None and bool(ne) != bool(oe)):
             return True, f"{sym} MA check {'ENABLED' if ne else 'DISABLED'}"
 
-        nth, oth = _as_float(n.get("ma_thr")), _as_float(o.get("ma_thr"))
+        nth, oth = n.ma_thr, o.ma_thr
         if (nth is None) != (oth is None) or (nth is not None and oth is not None and nth != oth):
             return True, f"{sym} MA threshold Δ=({oth}→{nth}%)"
 
-        if n.get("jump") != o.get("jump"):
-            return True, f"{sym} jump {o.get('jump')}→{n.get('jump')}"
+        if n.jump != o.jump:
+            return True, f"{sym} jump {o.jump}→{n.jump}"
 
     return False, None
@@ -1,6 +1,7 @@
 # bots/reporting/status_reporter.py
 from __future__ import annotations
 
+import inspect
 from dataclasses import dataclass
 from typing import Any, Dict, Optional, Callable, List, Union, Tuple
 
@@ -47,6 +48,18 @@ class StatusReporter:
         self.build_fn = build_fn
         self.extract_fn = extract_fn
         self.should_fn = should_fn
+        # ✅ extract_fn 호출 규약은 생성 시 1회만 판별(매 tick TypeError 재시도 제거)
+        self._extract_takes_fallback = self._accepts_kwarg(extract_fn, "fallback_ma_threshold_pct")
+
+    @staticmethod
+    def _accepts_kwarg(fn: Optional[Callable[..., Any]], name: str) -> bool:
+        if fn is None:
+            return False
+        try:
+            params = inspect.signature(fn).parameters
+        except (TypeError, ValueError):
+            return False
+        return name in params or any(p.kind is inspect.Parameter.VAR_KEYWORD for p in params.values())
 
     def tick(self, now_ts: float) -> None:
 
@@ -83,9 +96,9 @@ class StatusReporter:
 
         # ✅ extract
         if self.extract_fn:
-            try:
+            if self._extract_takes_fallback:
                 new_summary = self.extract_fn(new_status, fallback_ma_threshold_pct=None)
-            except TypeError:
+            else:
                 new_summary = self.extract_fn(new_status)
         else:
             new_summary = extract_market_status_summary(new_status, fallback_ma_threshold_pct=None)
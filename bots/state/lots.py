@@ -1,6 +1,7 @@
 # bots/state/lots.py
 from __future__ import annotations
 
+import functools
 import time
 import uuid
 from dataclasses import dataclass
@@ -15,6 +16,8 @@ def _now_ms() -> int:
     return int(time.time() * 1000)
 
 
+# ✅ (namespace, symbol, side) 조합당 키 문자열 1회만 생성(lot_id별 키는 매번 달라 캐시 안 함)
+@functools.lru_cache(maxsize=64)
 def _ns(namespace: str) -> str:
     n = (namespace or "bybit").strip()
     return f"trading:{n}"
@@ -24,11 +27,13 @@ def _lot_key(namespace: str, lot_id: str) -> str:
     return f"{_ns(namespace)}:lot:{lot_id}"
 
 
+@functools.lru_cache(maxsize=4096)
 def _open_zset_key(namespace: str, symbol: str, side: str) -> str:
     # ✅ lots로 시작 + OPEN 인덱스
     return f"{_ns(namespace)}:lots:{symbol}:{side}:OPEN"
 
 
+@functools.lru_cache(maxsize=64)
 def _by_signal_hash_key(namespace: str) -> str:
     # ✅ entry_signal_id -> lot_id 매핑을 hash 1개로 통합
     return f"{_ns(namespace)}:lots:by_signal:OPEN"
@@ -114,13 +119,14 @@ def close_lot_full(
     - by_signal hash에서도 제거(같이 정리)
     """
     hkey = _lot_key(namespace, lot_id)
-    if not redis_client.exists(hkey):
+    # ✅ exists + 필요한 3필드를 한 번의 왕복으로 (hget 3회 → hmget 1회)
+    pipe = redis_client.pipeline(transaction=False)
+    pipe.exists(hkey)
+    pipe.hmget(hkey, "symbol", "side", "entry_signal_id")
+    exists, (symbol_b, side_b, entry_signal_b) = pipe.execute()
+    if not exists:
         return False
 
-    symbol_b = redis_client.hget(hkey, "symbol")
-    side_b = redis_client.hget(hkey, "side")
-    entry_signal_b = redis_client.hget(hkey, "entry_signal_id")
-
     symbol = symbol_b.decode() if symbol_b else ""
     side = side_b.decode() if side_b else ""
     entry_signal_id = entry_signal_b.decode() if entry_signal_b else ""
@@ -199,6 +205,10 @@ class LotCacheItem:
     ex_lot_id: str = ""
 
 
+# load_from_redis가 읽는 lot 해시 필드(순서 고정)
+_LOT_CACHE_FIELDS = ("entry_ts_ms", "qty_total", "entry_price", "entry_signal_id", "ex_lot_id")
+
+
 class LotsIndex:
     """
     In-memory cache.
@@ -239,22 +249,27 @@ class LotsIndex:
                 if not lot_ids:
                     continue
 
-                arr: List[LotCacheItem] = []
+                # ✅ lot별 hgetall(N 왕복, 전 필드) → 캐시에 쓰는 필드만 hmget, 파이프라인 1 왕복
+                #    포함 기준은 예전 그대로 "해시가 존재하면"(캐시 필드가 전부 비어 있어도 포함) → exists도 같이
+                pipe = r.pipeline(transaction=False)
                 for lot_id in lot_ids:
-                    h = r.hgetall(_lot_key(namespace, lot_id))
-                    if not h:
-                        continue
+                    hkey = _lot_key(namespace, lot_id)
+                    pipe.exists(hkey)
+                    pipe.hmget(hkey, _LOT_CACHE_FIELDS)
+                rows = pipe.execute()
 
-                    def _get(k: str) -> str:
-                        b = h.get(k.encode())
-                        return b.decode() if b else ""
+                arr: List[LotCacheItem] = []
+                for lot_id, exists, vals in zip(lot_ids, rows[0::2], rows[1::2]):
+                    if not exists:
+                        continue
 
+                    ts_b, qty_b, px_b, sig_b, ex_b = (v.decode() if v else "" for v in vals)
                     try:
-                        entry_ts_ms = int(float(_get("entry_ts_ms") or "0"))
-                        qty_total = float(_get("qty_total") or "0")
-                        entry_price = float(_get("entry_price") or "0")
-                        entry_signal_id = _get("entry_signal_id") or ""
-                        ex_lot_id = _get("ex_lot_id") or ""
+                        entry_ts_ms = int(float(ts_b or "0"))
+                        qty_total = float(qty_b or "0")
+                        entry_price = float(px_b or "0")
+                        entry_signal_id = sig_b or ""
+                        ex_lot_id = ex_b or ""
                     except Exception:
                         continue
 
@@ -1,6 +1,7 @@
 # bots/state/signals.py
 from __future__ import annotations
 
+import functools
 import json
 import time
 import uuid
@@ -9,6 +10,11 @@ from typing import Any, Deque, Dict, List, Optional, Tuple
 from collections import deque
 
 from core.redis_client import redis_client
+
+try:
+    import orjson  # 선택 의존성
+except ImportError:
+    orjson = None
 from zoneinfo import ZoneInfo
 from datetime import datetime
 
@@ -21,12 +27,15 @@ def _now_ms() -> int:
     return int(time.time() * 1000)
 
 
+# ✅ 키 빌더는 (namespace, symbol, side) 조합이 몇 개뿐 → lru_cache로 strip/lower/f-string을 조합당 1회만
+@functools.lru_cache(maxsize=64)
 def _ns(namespace: str) -> str:
     n = (namespace or "bybit").strip().lower()
     return f"trading:{n}"
 
 
 # ---------- keys ----------
+@functools.lru_cache(maxsize=64)
 def stream_key(namespace: str) -> str:
     # 10일치 전체 로그(OPEN/CLOSE 전부)
     return f"{_ns(namespace)}:signals"
@@ -36,6 +45,7 @@ def signal_hash_key(namespace: str, signal_id: str) -> str:
     return f"{_ns(namespace)}:signal:{signal_id}"
 
 
+@functools.lru_cache(maxsize=4096)
 def open_zset_key(namespace: str, symbol: str, side: str) -> str:
     # "신호상 열린 상태"만 유지
     return f"{_ns(namespace)}:signals:{symbol}:{side}:ENTRY"
@@ -61,9 +71,24 @@ class OpenSignalStats:
 
 
 # ---------- json ----------
+# ✅ orjson 있으면 사용(압축 포맷). datetime/dataclass는 json(default=str)처럼 str()로 보냄.
+#    json 폴백도 같은 구분자를 써서 어느 경로로 직렬화됐든 payload_json/SIG 로그 포맷이 같음
+if orjson is not None:
+    _ORJSON_OPTS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+    _JSON_SEP = (",", ":")
+else:
+    _ORJSON_OPTS = 0
+    _JSON_SEP = (", ", ": ")
+
+
 def _json_dumps(payload: Any) -> str:
+    if orjson is not None:
+        try:
+            return orjson.dumps(payload, default=str, option=_ORJSON_OPTS).decode()
+        except Exception:
+            pass  # 64bit 초과 int 등 orjson 미지원 → json으로
     try:
-        return json.dumps(payload, ensure_ascii=False, default=str)
+        return json.dumps(payload, ensure_ascii=False, default=str, separators=_JSON_SEP)
     except Exception:
         return json.dumps(str(payload), ensure_ascii=False)
 
@@ -95,15 +120,18 @@ def record_signal_with_ts(
         ts_ms: Optional[int] = None,
         keep_days: int = 10,
         trim_approx: bool = True,
+        signal_id: Optional[str] = None,
+        payload_json: Optional[str] = None,
 ) -> Tuple[str, int]:
     """
     신호 발생 시점 기록 (체결/lot과 무관)
     - stream: 10일치 전체 로그 (XTRIM MINID ~ 로 유지)
     - hash: signal_id별 원문 (PEXPIRE로 자동 삭제)
     - open_zset: "열린 상태(ENTRY만)" 유지 (ENTRY add, EXIT zrem(open_signal_id))
+    - signal_id/payload_json: 호출측이 id를 미리 정하고 payload를 이미 직렬화했으면 그대로 사용
     return: (signal_id, ts_ms)
     """
-    sid = uuid.uuid4().hex
+    sid = signal_id or uuid.uuid4().hex
     ts = int(ts_ms or _now_ms())
 
     kind_u = _normalize_kind(kind)
@@ -138,7 +166,7 @@ def record_signal_with_ts(
         "side": side_u,
         "kind": kind_u,
         "price": "" if price is None else str(float(price)),
-        "payload_json": _json_dumps(payload),
+        "payload_json": payload_json if payload_json is not None else _json_dumps(payload),
         "created_ts_ms": str(_now_ms()),
     }
 
@@ -396,6 +424,12 @@ def record_and_index_signal(
         "engine": engine or namespace,
     }
 
+    # ✅ SIG 로그(JSON)에 유니크 id 포함 (텔레그램 rate-limit key로 사용 가능)
+    #    id/ts를 기록 전에 정해 sig_dict에 넣고 1회만 직렬화 → Redis payload_json과 SIG 로그가 같은 문자열
+    sig_dict["signal_id"] = uuid.uuid4().hex
+    sig_dict["ts_ms"] = _now_ms()
+    payload_json = _json_dumps(sig_dict)
+
     sid, ts_ms = record_signal_with_ts(
         namespace=namespace,
         symbol=sym_u,
@@ -403,12 +437,11 @@ def record_and_index_signal(
         kind=kind_u,
         price=price,
         payload=sig_dict,
+        ts_ms=sig_dict["ts_ms"],
+        signal_id=sig_dict["signal_id"],
+        payload_json=payload_json,
     )
 
-    # ✅ SIG 로그(JSON)에 유니크 id 포함 (텔레그램 rate-limit key로 사용 가능)
-    sig_dict["signal_id"] = sid
-    sig_dict["ts_ms"] = ts_ms
-
     # ✅ 로컬 캐시도 같이 갱신
     if kind_u == "ENTRY":
         # tag는 reasons[0] 사용 (INIT / SCALE_IN 등)
@@ -442,7 +475,7 @@ def record_and_index_signal(
     # ✅ 로그
     if trading_logger:
         try:
-            trading_logger.info("SIG " + json.dumps(sig_dict, ensure_ascii=False, default=str))
+            trading_logger.info("SIG " + payload_json)
         except Exception:
             trading_logger.info(f"SIG {sig_dict}")
 
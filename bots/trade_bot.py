@@ -455,15 +455,19 @@ class TradeBot:
         loop = asyncio.get_running_loop()
         # WS 링크 끊김 감지(전역, 1회/사이클). per-symbol 게이트와 별개로 동작.
         self._check_ws_link()
-        for symbol in self.symbols:
+        # market tick은 WS stale 시 동기 REST 백필(블로킹 requests ×N)을 수행한다.
+        # 이벤트 루프에서 직접 돌리면 그동안 루프가 얼어 안전브레이커(loop.call_later)까지
+        # 못 떠 영구 hang이 됨 → executor 스레드로 빼서 루프가 항상 살아있게 한다.
+        # ✅ 전 심볼 tick을 executor 스레드 하나에서 순차 실행(캔들 엔진/지표 유일 접근자 → 추가 락 불필요),
+        #    REST 백필만 tick_all 안에서 모아 동시에 돌린다. WS 컨트롤러는 자체 락으로 thread-safe.
+        now = time.time()
+        klines = self.market.confirmed_klines(self.symbols)  # 확정봉은 WS lock 1회로 전 심볼 스냅샷
+        fresh = self.market.fresh_mask(self.symbols)  # WS freshness도 사이클당 1회 배치 판정
+        prices = await loop.run_in_executor(None, self.market.tick_all, self.symbols, now, klines, fresh)
+        for symbol, price in zip(self.symbols, prices):
             try:
-                now = time.time()
-                # market.tick()은 WS stale 시 동기 REST 백필(블로킹 requests ×N)을 수행한다.
-                # 이벤트 루프에서 직접 돌리면 그동안 루프가 얼어 안전브레이커(loop.call_later)까지
-                # 못 떠 영구 hang이 됨 → executor 스레드로 빼서 루프가 항상 살아있게 한다.
-                # tick은 run_once에서만 순차 await로 호출되므로 동시 tick이 없고(캔들 엔진 유일 접근자),
-                # WS 컨트롤러는 자체 락으로 thread-safe → 추가 락 불필요.
-                price = await loop.run_in_executor(None, self.market.tick, symbol, now)
+                if isinstance(price, BaseException):
+                    raise price
 
                 # ✅ 세션/피드 게이트: 이 심볼의 시세 피드가 stale면(장 마감 등)
                 #    신호 생성 자체를 건너뛴다. tick()/get_price()는 장 마감 후에도
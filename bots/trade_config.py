@@ -55,7 +55,7 @@ class RedisConfig:
             password=_optional("REDIS_PASSWORD"),
         )
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TradeConfig:
     # 어떤 용도/엔진인지 구분용 (예: "bybit", "mt5_signal")
     name: str = "default"
@@ -65,8 +65,8 @@ class TradeConfig:
     position_max_hold_sec: int = 7 * 24 * 3600  # ✅ 7일 기본
     near_touch_window_sec: int = 60 * 30  # ✅ 30분 기본
 
-    # 이 설정이 다루는 심볼 목록 (프론트/봇에서 공통으로 사용)
-    symbols: List[str] = field(default_factory=list)
+    # 이 설정이 다루는 심볼 목록 (프론트/봇에서 공통으로 사용). normalized()에서 tuple로 고정.
+    symbols: Tuple[str, ...] = ()
 
     # 실행/네트워크
     ws_stale_sec: float = 30.0
@@ -163,7 +163,7 @@ class TradeConfig:
             position_max_hold_sec=max(600, int(self.position_max_hold_sec)),
             near_touch_window_sec=max(0, int(self.near_touch_window_sec)),
             min_ma_threshold=max(0.0, float(self.min_ma_threshold)),
-            symbols=list(self.symbols),
+            symbols=tuple(self.symbols or ()),
         )
 
 
@@ -3,6 +3,7 @@ import time
 import hmac
 import hashlib
 import json
+import threading
 from urllib.parse import urlencode
 
 import requests
@@ -25,10 +26,19 @@ class BybitRestBase:
         self.recv_window = "15000"
         self._time_offset_ms = 0
         self._symbol_rules: dict[str, dict] = {}
+        # ✅ 스레드별 requests.Session(keep-alive 재사용). bootstrap 풀 워커가 동시에 호출해도 세션 공유 없음
+        self._http_local = threading.local()
 
         # ⏱ 서명 검증은 trade 서버가 하므로 trade 기준으로 동기화
         self.sync_time()
 
+    def _session(self) -> requests.Session:
+        sess = getattr(self._http_local, "session", None)
+        if sess is None:
+            sess = requests.Session()
+            self._http_local.session = sess
+        return sess
+
     # -------------------------
     # Query builder
     # -------------------------
@@ -98,9 +108,9 @@ class BybitRestBase:
         def _send():
             hdrs = _make_headers()
             if method == "GET":
-                return requests.get(url, headers=hdrs, timeout=timeout)
+                return self._session().get(url, headers=hdrs, timeout=timeout)
             hdrs = {**hdrs, "Content-Type": "application/json"}
-            return requests.post(url, headers=hdrs, data=body_str, timeout=timeout)
+            return self._session().post(url, headers=hdrs, data=body_str, timeout=timeout)
 
         resp = _send()
 
@@ -3,8 +3,6 @@
 import time
 from datetime import timezone, timedelta
 
-import requests
-
 KST = timezone(timedelta(hours=9))
 
 
@@ -25,8 +23,9 @@ class BybitRestMarketMixin:
         """캔들 1페이지 요청. rate-limit(10006/429)은 지수 백오프로 조용히 재시도.
         시작 시 여러 서비스가 동시에 대량 백필해도 텔레 스팸 없이 흡수."""
         delay = 0.5
+        get = self._session().get  # 페이지네이션 동안 같은 연결 재사용
         for attempt in range(max_retries + 1):
-            res = requests.get(url, params=params, timeout=10)
+            res = get(url, params=params, timeout=10)
             if res.status_code == 429:
                 if attempt < max_retries:
                     time.sleep(delay); delay = min(delay * 2, 8.0); continue
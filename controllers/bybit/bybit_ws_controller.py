@@ -2,6 +2,12 @@
 import threading
 import time
 import json
+
+try:
+    import orjson  # 선택 의존성: 있으면 프레임 파싱을 orjson으로(수 배 빠름)
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 from websocket import WebSocketApp
 
 
@@ -27,6 +33,10 @@ class BybitWebSocketController:
         self._last_tick_monotonic: dict[str, float] = {}
         self._last_exchange_ts: dict[str, float] = {}
 
+        # ✅ 틱 push 리스너: fn(symbol, price, exchange_ts). WS 스레드에서 lock 밖에서 호출됨.
+        #    (copy-on-write 리스트 → 호출 시 lock 없이 순회)
+        self._tick_listeners: list = []
+
         self._reconnect_delay = 5
         self._start_public_websocket()
 
@@ -59,6 +69,12 @@ class BybitWebSocketController:
                 return self._last_recv_monotonic_global or None
             return self._last_recv_monotonic.get(symbol)
 
+    def get_last_recv_map(self, symbols) -> tuple[float | None, dict[str, float | None]]:
+        """(전역 수신 시각, {symbol: 심볼별 수신 시각}) 을 lock 1회로 스냅샷 (monotonic)."""
+        with self._lock:
+            recv = self._last_recv_monotonic
+            return self._last_recv_monotonic_global or None, {s: recv.get(s) for s in symbols}
+
     # ──────────────────────────────────────────────
     # 런타임 구독 제어
     def subscribe_symbols(self, *new_symbols):
@@ -99,6 +115,27 @@ class BybitWebSocketController:
             except Exception:
                 pass
 
+    def add_tick_listener(self, fn) -> None:
+        """틱 수신 시 fn(symbol, price, exchange_ts) 호출(WS 스레드). 폴링 없이 틱 도착을 받고 싶을 때."""
+        with self._lock:
+            if fn not in self._tick_listeners:
+                self._tick_listeners = self._tick_listeners + [fn]
+
+    def remove_tick_listener(self, fn) -> None:
+        with self._lock:
+            self._tick_listeners = [f for f in self._tick_listeners if f is not fn]
+
+    def _notify_ticks(self, ticks) -> None:
+        listeners = self._tick_listeners
+        if not listeners:
+            return
+        for fn in listeners:
+            for sym, price, exch_ts in ticks:
+                try:
+                    fn(sym, price, exch_ts)
+                except Exception:
+                    pass
+
     def get_last_frame_time(self) -> float | None:
         return self._last_frame_monotonic or None
 
@@ -112,6 +149,13 @@ class BybitWebSocketController:
         with self._lock:
             return self._last_kline_confirmed.get((symbol, interval))
 
+    def get_last_confirmed_klines(self, symbols, interval: str | None = None) -> dict[str, dict | None]:
+        """여러 심볼의 마지막 확정봉을 lock 1회로 스냅샷."""
+        interval = interval or self.kline_interval
+        with self._lock:
+            confirmed = self._last_kline_confirmed
+            return {s: confirmed.get((s, interval)) for s in symbols}
+
     # ──────────────────────────────────────────────
     def _start_public_websocket(self):
         def on_open(ws):
@@ -136,12 +180,12 @@ class BybitWebSocketController:
 
         def on_message(ws, message: str):
             try:
-                parsed = json.loads(message)
+                parsed = _json_loads(message)
                 now_mono = time.monotonic()
                 topic = parsed.get("topic", "")
-                with self._lock:
-                    self._last_frame_monotonic = now_mono
-                    self._last_recv_monotonic_global = now_mono
+                # ✅ float 단일 대입은 GIL 하에서 원자적 → 프레임 시각은 lock 없이 갱신(프레임당 lock 1회)
+                self._last_frame_monotonic = now_mono
+                self._last_recv_monotonic_global = now_mono
                 if topic == "hb":
                     return
 
@@ -151,6 +195,7 @@ class BybitWebSocketController:
 
                 items = data if isinstance(data, list) else [data]
                 frame_ts_ms = parsed.get("ts")
+                ticks = []
 
                 with self._lock:
                     for item in items:
@@ -182,6 +227,7 @@ class BybitWebSocketController:
                             self._last_tick_monotonic[sym] = now_mono
                             self._last_exchange_ts[sym] = exch_ts
                             self._last_recv_monotonic[sym] = now_mono  # ✅ 추가 (심볼별 recv)
+                            ticks.append((sym, price, exch_ts))
                             continue
 
                         if topic.startswith("kline."):
@@ -216,6 +262,9 @@ class BybitWebSocketController:
                             self._last_recv_monotonic[sym] = now_mono  # ✅ 추가 (심볼별 recv)
                             continue
 
+                if ticks:
+                    self._notify_ticks(ticks)  # ✅ lock 밖에서 리스너 호출
+
             except Exception as e:
                 if self.system_logger:
                     self.system_logger.debug(f"❌ Public 메시지 처리 오류: {e}")
@@ -1,5 +1,6 @@
 # controllers/mt5/mt5_rest_base.py
 import json
+import threading
 from typing import Any, Dict, Optional
 import requests
 
@@ -29,6 +30,8 @@ class Mt5RestBase:
         self.api_key = api_key
         self._symbol_rules: dict[str, dict] = {}
         self.symbol_map = symbol_map  # SymbolAliasMap | None
+        # ✅ 스레드별 requests.Session(keep-alive 재사용). bootstrap 풀 워커가 동시에 호출해도 세션 공유 없음
+        self._http_local = threading.local()
 
     def _broker_sym(self, symbol: str) -> str:
         """Canonical → broker symbol. No-op if no mapping set."""
@@ -37,6 +40,13 @@ class Mt5RestBase:
             return self.symbol_map.to_broker(s)
         return s
 
+    def _session(self) -> requests.Session:
+        sess = getattr(self._http_local, "session", None)
+        if sess is None:
+            sess = requests.Session()
+            self._http_local.session = sess
+        return sess
+
     # -------------------------
     # URL / 헤더 빌더
     # -------------------------
@@ -83,7 +93,7 @@ class Mt5RestBase:
 
         try:
             if method.upper() == "GET":
-                resp = requests.get(
+                resp = self._session().get(
                     url,
                     headers=self._get_headers(use=use),
                     params=params,
@@ -91,7 +101,7 @@ class Mt5RestBase:
                 )
             else:
                 body = json.dumps(body_dict or {}, separators=(",", ":"))
-                resp = requests.post(
+                resp = self._session().post(
                     url,
                     headers=self._get_headers(use=use),
                     params=params,
@@ -2,6 +2,12 @@
 import threading
 import time
 import json
+
+try:
+    import orjson  # 선택 의존성: 있으면 프레임 파싱을 orjson으로(수 배 빠름)
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 from typing import Optional
 from websocket import WebSocketApp
 
@@ -43,6 +49,10 @@ class Mt5WebSocketController:
         self._bid: dict[str, float] = {}
         self._ask: dict[str, float] = {}
 
+        # ✅ 틱 push 리스너: fn(symbol, price, exchange_ts). WS 스레드에서 lock 밖에서 호출됨.
+        #    (copy-on-write 리스트 → 호출 시 lock 없이 순회)
+        self._tick_listeners: list = []
+
         # 재연결 backoff
         self._reconnect_delay = 5
 
@@ -108,6 +118,33 @@ class Mt5WebSocketController:
                 return self._last_recv_monotonic_global or None
             return self._last_recv_monotonic.get(symbol)
 
+    def get_last_recv_map(self, symbols) -> tuple[float | None, dict[str, float | None]]:
+        """(전역 수신 시각, {symbol: 심볼별 수신 시각}) 을 lock 1회로 스냅샷 (monotonic)."""
+        with self._lock:
+            recv = self._last_recv_monotonic
+            return self._last_recv_monotonic_global or None, {s: recv.get(s) for s in symbols}
+
+    def add_tick_listener(self, fn) -> None:
+        """틱 수신 시 fn(symbol, price, exchange_ts) 호출(WS 스레드). 폴링 없이 틱 도착을 받고 싶을 때."""
+        with self._lock:
+            if fn not in self._tick_listeners:
+                self._tick_listeners = self._tick_listeners + [fn]
+
+    def remove_tick_listener(self, fn) -> None:
+        with self._lock:
+            self._tick_listeners = [f for f in self._tick_listeners if f is not fn]
+
+    def _notify_ticks(self, ticks) -> None:
+        listeners = self._tick_listeners
+        if not listeners:
+            return
+        for fn in listeners:
+            for sym, price, exch_ts in ticks:
+                try:
+                    fn(sym, price, exch_ts)
+                except Exception:
+                    pass
+
     def get_last_frame_time(self) -> Optional[float]:
         return self._last_frame_monotonic or None
 
@@ -121,6 +158,13 @@ class Mt5WebSocketController:
         with self._lock:
             return self._last_kline_confirmed.get((symbol, interval))
 
+    def get_last_confirmed_klines(self, symbols, interval: str | None = None) -> dict[str, Optional[dict]]:
+        """여러 심볼의 마지막 확정봉을 lock 1회로 스냅샷."""
+        interval = interval or self.kline_interval
+        with self._lock:
+            confirmed = self._last_kline_confirmed
+            return {s: confirmed.get((s, interval)) for s in symbols}
+
     # ──────────────────────────────────────────────
     # 구독 제어
     # ──────────────────────────────────────────────
@@ -191,14 +235,18 @@ class Mt5WebSocketController:
         def on_pong(ws: WebSocketApp, data):
             self._last_frame_monotonic = time.monotonic()
 
-        def on_message(ws: WebSocketApp, message: str):
+        def on_message(ws: WebSocketApp, message: bytes | str):
+            # skip_utf8_validation=True면 websocket-client가 텍스트 프레임도 bytes로 넘김(json/orjson은 bytes 그대로 파싱)
 
 
             try:
-                parsed = json.loads(message)
+                parsed = _json_loads(message)
             except Exception:
                 if self.system_logger:
-                    self.system_logger.debug(f"❌ MT5 WS JSON 파싱 실패: {message[:200]}")
+                    head = message[:200]
+                    if isinstance(head, bytes):
+                        head = head.decode(errors="replace")
+                    self.system_logger.debug(f"❌ MT5 WS JSON 파싱 실패: {head}")
                 return
 
 
@@ -209,9 +257,9 @@ class Mt5WebSocketController:
             if not topic:
                 return
 
-            with self._lock:
-                self._last_frame_monotonic = now_mono
-                self._last_recv_monotonic_global = now_mono
+            # ✅ float 단일 대입은 GIL 하에서 원자적 → 프레임 시각은 lock 없이 갱신(프레임당 lock 1회)
+            self._last_frame_monotonic = now_mono
+            self._last_recv_monotonic_global = now_mono
 
             # ✅ heartbeat는 여기서 끝
             if topic == "hb":
@@ -271,6 +319,7 @@ class Mt5WebSocketController:
                     self._last_tick_monotonic[sym] = now_mono   # ✅ 복구
                     self._last_exchange_ts[sym] = exch_ts
                     self._last_recv_monotonic[sym] = now_mono   # ✅ 추가
+                self._notify_ticks(((sym, price, exch_ts),))  # ✅ lock 밖에서 리스너 호출
                 return
             # ─────────────────────
             # 2) Kline
@@ -285,6 +334,7 @@ class Mt5WebSocketController:
 
                 items = data if isinstance(data, list) else [data]
 
+                parsed_bars = []
                 for bar in items:
                     try:
                         confirm = bool(bar.get("confirm", False))
@@ -308,12 +358,17 @@ class Mt5WebSocketController:
                         "ts": int(bar.get("timestamp") or bar.get("ts") or 0),
                     }
 
-                    key = (sym, interval)
-                    with self._lock:
+                    parsed_bars.append(k)
+
+                if not parsed_bars:
+                    return
+                key = (sym, interval)
+                with self._lock:  # ✅ 봉 여러 개여도 lock 1회
+                    for k in parsed_bars:
                         self._last_kline[key] = k
                         if k["confirm"]:
                             self._last_kline_confirmed[key] = k
-                        self._last_recv_monotonic[sym] = now_mono  # ✅ 추가
+                    self._last_recv_monotonic[sym] = now_mono  # ✅ 추가
 
         def on_error(ws: WebSocketApp, error):
             if self.system_logger:
@@ -337,7 +392,9 @@ class Mt5WebSocketController:
                         on_close=on_close,
                         on_pong=on_pong,
                     )
-                    ws_app.run_forever(ping_interval=20, ping_timeout=10)
+                    # websocket-client는 permessage-deflate를 협상하지 않음 → 프레임은 이미 비압축.
+                    # 텍스트 프레임 UTF-8 검증(wsaccel 없으면 순수 파이썬 루프)은 생략: 어차피 json.loads가 검증.
+                    ws_app.run_forever(ping_interval=20, ping_timeout=10, skip_utf8_validation=True)
 
                     # ✅ 여기로 내려오면 연결이 종료된 것 → backoff 후 재연결
                     delay = self._reconnect_delay
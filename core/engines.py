@@ -1,6 +1,7 @@
 # engines.py
 from dataclasses import dataclass
 from decimal import Decimal, ROUND_HALF_UP
+from array import array
 from collections import deque
 from typing import (
     Iterable,
@@ -18,6 +19,8 @@ import time
 from datetime import datetime, timedelta, timezone
 
 KST = timezone(timedelta(hours=9))
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_US = timedelta(microseconds=1)
 
 
 @dataclass
@@ -47,6 +50,14 @@ class CandleEngine:
         self.ensure_symbol(symbol)
         return self.candles[symbol]
 
+    def get_last_minute(self, symbol: str) -> Optional[int]:
+        """마지막 확정 캔들의 minute(epoch // 60). 캔들이 없으면 None. 틱마다 불려서 deque 생성/복사 없이 끝만 읽음."""
+        dq = self.candles.get(symbol)
+        if not dq:
+            return None
+        m = dq[-1].get("minute")
+        return int(m) if m is not None else None
+
     def get_state(self, symbol: str) -> Optional[CandleState]:
         return self._state.get(symbol)
 
@@ -153,21 +164,33 @@ class IndicatorEngine:
     # ─────────────────────────────────────────────
     @staticmethod
     def ma100_list(prices: Sequence[Optional[float]]) -> List[Optional[float]]:
-        ma100s: List[Optional[float]] = []
+        # ✅ 롤링 합 O(N): 윈도우마다 100개 재합산(O(N·100)) 대신 들어온 값 더하고 빠진 값 뺌.
+        #    None 개수도 롤링 카운트. 누적 오차는 100스텝마다 윈도우 재합산으로 리셋.
         n = len(prices)
+        ma100s: List[Optional[float]] = [None] * n
+        vals = [None if v is None else float(v) for v in prices]
+        s = 0.0
+        nones = 0
         for i in range(n):
+            v = vals[i]
+            if v is None:
+                nones += 1
+            else:
+                s += v
+            if i >= 100:
+                old = vals[i - 100]
+                if old is None:
+                    nones -= 1
+                else:
+                    s -= old
             if i < 99:
                 # 샘플이 100개 미만이면 MA100 없음
-                ma100s.append(None)
                 continue
-
-            window = prices[i - 99 : i + 1]
+            if i % 100 == 99:
+                s = sum(x for x in vals[i - 99 : i + 1] if x is not None)
             # 쉬는 시간(빈 캔들) 포함 → None 있으면 이 시점 MA도 None
-            if any(v is None for v in window):
-                ma100s.append(None)
-            else:
-                s = sum(float(v) for v in window)  # type: ignore[arg-type]
-                ma100s.append(s / 100.0)
+            if nones == 0:
+                ma100s[i] = s / 100.0
         return ma100s
 
     # ─────────────────────────────────────────────
@@ -216,106 +239,103 @@ class IndicatorEngine:
         return cross_times, q_thr, ma100s
 
     # ─────────────────────────────────────────────
-    # threshold에 따른 cross 횟수 세기
+    # cross 판정용 컬럼(1회 추출)
+    # - 이분 탐색이 _count_cross를 ~21회 돌리므로 dict 조회/float 변환/시각 계산은 여기서 한 번만
+    # - 행: (high, low, close, ma, t_us, i, minute)  t_us = 캔들 시각(epoch µs, 정수 → 간격 비교 오차 없음)
     # ─────────────────────────────────────────────
-    def _count_cross(
-        self,
+    @staticmethod
+    def _cross_rows(
         candles: Sequence[Candle],
         ma100s: Sequence[Optional[float]],
-        threshold: float,
         now_kst: Optional[datetime] = None,
-        min_cross_interval_sec: int = 3600,
-    ) -> Tuple[int, List[Tuple[str, str, float, float, float]]]:
+    ) -> Tuple[List[Tuple[float, float, float, float, int, int, Any]], datetime]:
         if now_kst is None:
             now_kst = datetime.now(KST)
-
-        count = 0
-        cross_times: List[Tuple[str, str, float, float, float]] = []
-        last_state: Optional[str] = None  # "above", "below", "in"
-
-        last_cross_time_up: Optional[datetime] = None
-        last_cross_time_down: Optional[datetime] = None
-
+        now_us = (now_kst - _EPOCH) // _US
         total_len = len(candles)
 
+        rows = []
         for i, (candle, ma) in enumerate(zip(candles, ma100s)):
             # MA가 없으면(샘플 부족, 쉬는 시간 포함) 스킵
             if ma is None:
                 continue
-
             high = candle.get("high")
             low = candle.get("low")
             close = candle.get("close")
-
             # 가격이 None이면(쉬는 시간) 이 구간도 스킵
             if high is None or low is None or close is None:
                 continue
 
-            high = float(high)
-            low = float(low)
-            close = float(close)
-
-            upper = ma * (1 + threshold)
-            lower = ma * (1 - threshold)
+            # 현재 캔들 시점 추정(분 없으면 now 기준 fallback)
+            m = candle.get("minute")
+            if m is not None:
+                t_us = int(m) * 60_000_000
+            else:
+                t_us = now_us - (total_len - i) * 60_000_000
+            rows.append((float(high), float(low), float(close), ma, t_us, i, m))
+        return rows, now_kst
 
-            # ---- cross 발생 여부 (range 기준) ----
-            up_cross = last_state in ("below", "in") and high > upper
-            down_cross = last_state in ("above", "in") and low < lower
+    # ─────────────────────────────────────────────
+    # threshold에 따른 cross 횟수 세기
+    # ─────────────────────────────────────────────
+    def _count_cross(
+        self,
+        candles: Sequence[Candle],
+        ma100s: Sequence[Optional[float]],
+        threshold: float,
+        now_kst: Optional[datetime] = None,
+        min_cross_interval_sec: int = 3600,
+        *,
+        rows: Optional[Tuple[List[Tuple[float, float, float, float, int, int, Any]], datetime]] = None,
+    ) -> Tuple[int, List[Tuple[str, str, float, float, float]]]:
+        if rows is None:
+            rows = self._cross_rows(candles, ma100s, now_kst)
+        row_list, now_kst = rows
+        total_len = len(candles)
+        min_gap_us = min_cross_interval_sec * 1_000_000
 
-            # 현재 캔들 시점(KST 기준) 추정
-            m = candle.get("minute")
+        def _iso(i: int, m) -> str:
+            # datetime은 cross가 실제로 기록될 때만 만든다
             if m is not None:
-                cross_time_base = datetime.fromtimestamp(int(m) * 60, tz=KST)
+                dt = datetime.fromtimestamp(int(m) * 60, tz=KST)
             else:
-                cross_time_base = now_kst - timedelta(minutes=total_len - i)  # fallback
-            if up_cross:
-                cross_time = cross_time_base
-                if (
-                    not last_cross_time_up
-                    or (cross_time - last_cross_time_up).total_seconds()
-                    > min_cross_interval_sec
-                ):
-                    count += 1
-                    cross_times.append(
-                        (
-                            "UP",
-                            cross_time.isoformat(timespec="seconds"),
-                            upper,
-                            close,  # 로그에는 close 남김
-                            ma,
-                        )
-                    )
-                    last_cross_time_up = cross_time
-
-            if down_cross:
-                cross_time = cross_time_base
-                if (
-                    not last_cross_time_down
-                    or (cross_time - last_cross_time_down).total_seconds()
-                    > min_cross_interval_sec
-                ):
-                    count += 1
-                    cross_times.append(
-                        (
-                            "DOWN",
-                            cross_time.isoformat(timespec="seconds"),
-                            lower,
-                            close,
-                            ma,
-                        )
-                    )
-                    last_cross_time_down = cross_time
+                dt = now_kst - timedelta(minutes=total_len - i)  # fallback
+            return dt.isoformat(timespec="seconds")
+
+        up_k = 1 + threshold
+        down_k = 1 - threshold
+
+        count = 0
+        cross_times: List[Tuple[str, str, float, float, float]] = []
+        last_state: Optional[str] = None  # "above", "below", "in"
+
+        last_cross_up_us: Optional[int] = None
+        last_cross_down_us: Optional[int] = None
+
+        for high, low, close, ma, t_us, i, m in row_list:
+            upper = ma * up_k
+            lower = ma * down_k
+
+            # ---- cross 발생 여부 (range 기준) ----
+            if last_state is not None:
+                if last_state != "above" and high > upper:  # below/in → 위로 돌파
+                    if last_cross_up_us is None or (t_us - last_cross_up_us) > min_gap_us:
+                        count += 1
+                        cross_times.append(("UP", _iso(i, m), upper, close, ma))  # 로그에는 close 남김
+                        last_cross_up_us = t_us
+                if last_state != "below" and low < lower:  # above/in → 아래로 돌파
+                    if last_cross_down_us is None or (t_us - last_cross_down_us) > min_gap_us:
+                        count += 1
+                        cross_times.append(("DOWN", _iso(i, m), lower, close, ma))
+                        last_cross_down_us = t_us
 
             # ---- 다음 스텝에서의 상태는 close 기준으로 ----
             if close > upper:
-                state = "above"
+                last_state = "above"
             elif close < lower:
-                state = "below"
+                last_state = "below"
             else:
-                state = "in"
-
-            # ✅ 들여쓰기 버그 수정: 항상 last_state 갱신
-            last_state = state
+                last_state = "in"
 
         return count, cross_times
 
@@ -340,12 +360,13 @@ class IndicatorEngine:
 
         left, right = float(min_thr), float(max_thr)
         optimal = right
+        rows = self._cross_rows(candles, ma100s)  # ✅ 후보 threshold마다 재추출하지 않음
 
         # 간단한 이분 탐색으로 target_cross 근처 threshold 찾기
         for _ in range(20):
             mid = (left + right) / 2.0
             crosses, _ = self._count_cross(
-                candles, ma100s, mid, min_cross_interval_sec=min_cross_interval_sec
+                candles, ma100s, mid, min_cross_interval_sec=min_cross_interval_sec, rows=rows
             )
 
             if crosses > target_cross:
@@ -357,7 +378,7 @@ class IndicatorEngine:
                 right = mid
 
         crosses, cross_times = self._count_cross(
-            candles, ma100s, optimal, min_cross_interval_sec=min_cross_interval_sec
+            candles, ma100s, optimal, min_cross_interval_sec=min_cross_interval_sec, rows=rows
         )
         # 최소 min_thr 이하로는 떨어지지 않도록
         return cross_times, max(optimal, min_thr)
@@ -366,15 +387,28 @@ class IndicatorEngine:
 class JumpDetector:
     """최근 n개 가격 히스토리로 급등락 감지"""
 
+    # ✅ 생성 후 고정되는 파라미터/상태 → slot (틱마다 읽히는 history_num 등 __dict__ 조회 제거)
+    __slots__ = ("history_num", "polling_interval", "price_history", "_sym_idx", "_counts")
+
     def __init__(self, history_num=10, polling_interval=0.5):
         self.history_num = history_num
         self.polling_interval = polling_interval
         # symbol -> deque[(exchange_ts, recv_ts, price)]
         self.price_history: Dict[str, Deque[Tuple[float, float, float]]] = {}
+        # ✅ 심볼별 기록 개수(history_num에서 포화). 심볼 인덱스로 접근 → 워밍업 준비 판정이 len() 없이 O(1)
+        self._sym_idx: Dict[str, int] = {}
+        self._counts = array("i")
 
     def ensure_symbol(self, symbol: str):
         if symbol not in self.price_history:
             self.price_history[symbol] = deque(maxlen=self.history_num)
+            self._sym_idx[symbol] = len(self._counts)
+            self._counts.append(0)
+
+    def history_count(self, symbol: str) -> int:
+        """기록된 틱 수(최대 history_num). 처음 보는 심볼은 0."""
+        i = self._sym_idx.get(symbol)
+        return 0 if i is None else self._counts[i]
 
     def record_price(
         self,
@@ -384,19 +418,28 @@ class JumpDetector:
         recv_ts: float | None = None,
     ):
         """거래소 timestamp + 로컬 timestamp + 가격을 함께 기록"""
-        self.ensure_symbol(symbol)
-        if not isinstance(price, (int, float)) or not (price > 0) or math.isnan(price) or math.isinf(price):
+        # ✅ 틱마다 호출: dict 조회 1회(처음 보는 심볼만 ensure_symbol), isfinite 한 번으로 nan/inf 동시 배제
+        ph = self.price_history.get(symbol)
+        if ph is None:
+            self.ensure_symbol(symbol)
+            ph = self.price_history[symbol]
+        if not isinstance(price, (int, float)) or not (price > 0) or not math.isfinite(price):
             return
 
         recv_ts = recv_ts or time.time()
         exchange_ts = exchange_ts or recv_ts  # fallback
 
-        ph = self.price_history[symbol]
         # recv_ts 단조 증가 유지
-        if ph and recv_ts <= ph[-1][1]:
-            recv_ts = ph[-1][1] + 1e-6
+        if ph:
+            last_recv = ph[-1][1]
+            if recv_ts <= last_recv:
+                recv_ts = last_recv + 1e-6
 
         ph.append((float(exchange_ts), float(recv_ts), float(price)))
+        counts = self._counts
+        i = self._sym_idx[symbol]
+        if counts[i] < self.history_num:
+            counts[i] += 1
 
     def check_jump(
         self,
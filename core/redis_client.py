@@ -36,6 +36,10 @@ def _make_redis_client():
         return redis.from_url(
             REDIS_URL,
             decode_responses=False,  # 기존 redis.Redis 기본과 동일
+            # ✅ 풀 연결 재사용 시 NAT/LB가 조용히 끊은 소켓을 커맨드 전에 걸러냄
+            #    (idle 연결은 keepalive로 유지 + 30초 이상 쉬었으면 PING 후 사용 → 첫 커맨드 타임아웃/재연결 방지)
+            socket_keepalive=True,
+            health_check_interval=30,
         )
 
 redis_client = _make_redis_client()
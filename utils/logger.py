@@ -1,4 +1,4 @@
-import logging, os, json, html, requests
+import logging, logging.handlers, os, json, html, queue, functools, threading, requests
 from pathlib import Path
 
 import time
@@ -52,10 +52,25 @@ class SigOrWarning(logging.Filter):
         except Exception:
             return False
 
+# ✅ api.telegram.org 연결 재사용(요청마다 TCP+TLS 핸드셰이크 생략)
+#    requests.Session은 thread-safe 보장이 없음 → 로깅하는 스레드(WS/executor/루프)별로 1개씩
+_tg_local = threading.local()
+
+def _tg_session() -> requests.Session:
+    sess = getattr(_tg_local, "session", None)
+    if sess is None:
+        sess = requests.Session()
+        _tg_local.session = sess
+    return sess
+
+@functools.lru_cache(maxsize=8)
+def _tg_send_url(bot_token: str) -> str:
+    # ✅ 토큰별 URL은 한 번만 조립(핸들러가 같은 토큰으로 매번 호출)
+    return f"https://api.telegram.org/bot{bot_token}/sendMessage"
+
 def send_telegram_message(bot_token: str, chat_id: str, message: str):
-    url = f"https://api.telegram.org/bot{bot_token}/sendMessage"
-    requests.post(
-        url,
+    _tg_session().post(
+        _tg_send_url(bot_token),
         data={"chat_id": chat_id, "text": message},   # ✅ parse_mode 제거
         timeout=10,
     ).raise_for_status()
@@ -184,6 +199,25 @@ class TelegramLogHandler(logging.Handler):
         except Exception as e:
             print(f"TelegramLogHandler Error: {e}")
 
+class _BackgroundHandler(logging.handlers.QueueHandler):
+    """target 핸들러의 write를 QueueListener(데몬 스레드)로 넘긴다 → emit 쪽은 큐 put만.
+    close() 시 큐에 남은 레코드까지 target에 쓰고 닫는다(logging.shutdown에서도 호출됨)."""
+    def __init__(self, target: logging.Handler):
+        super().__init__(queue.SimpleQueue())
+        self._target = target
+        self._listener = logging.handlers.QueueListener(self.queue, target, respect_handler_level=True)
+        self._listener.start()
+
+    def close(self):
+        try:
+            if self._listener is not None:
+                self._listener.stop()
+                self._listener = None
+            self._target.close()
+        finally:
+            super().close()
+
+
 def _project_root(start_file: str = __file__) -> Path:
     """파일 위치에서 위로 올라가며 프로젝트 루트를 추정(.git/pyproject/requirements 기준)."""
     p = Path(start_file).resolve()
@@ -218,9 +252,13 @@ def setup_logger(
     logger.setLevel(logger_level)
     logger.propagate = False                     # ✅ 상위 전파 차단
 
-    # ✅ 중복 방지: 기존 핸들러 제거
+    # ✅ 중복 방지: 기존 핸들러 제거(+close → 재호출/리로드 시 파일 핸들/텔레그램 워커 누수 방지)
     for h in list(logger.handlers):
         logger.removeHandler(h)
+        try:
+            h.close()
+        except Exception:
+            pass
 
     # 포맷
     human_fmt = logging.Formatter("%(asctime)s - %(levelname)s - %(name)s - %(message)s",
@@ -245,8 +283,11 @@ def setup_logger(
         fh_sig = logging.FileHandler(log_dir / signals_filename, encoding="utf-8")
         fh_sig.setLevel(logging.INFO)
         fh_sig.setFormatter(logging.Formatter("%(message)s"))  # JSON 그대로
-        fh_sig.addFilter(OnlySIG())
-        logger.addHandler(fh_sig)
+        # ✅ 파일 write는 백그라운드 스레드에서 → 신호 발생 시 봇 루프가 디스크 I/O로 안 막힘
+        bg_sig = _BackgroundHandler(fh_sig)
+        bg_sig.setLevel(logging.INFO)
+        bg_sig.addFilter(OnlySIG())
+        logger.addHandler(bg_sig)
 
     # 텔레그램
     if enable_telegram: